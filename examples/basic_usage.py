@@ -11,6 +11,13 @@ Demonstrates:
 """
 
 import asyncio
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from ad_seller.flows import (
     ProductSetupFlow,
     DiscoveryInquiryFlow,
@@ -29,23 +36,13 @@ async def main():
     # Step 1: Initialize products
     print("\n1. Setting up products...")
     setup_flow = ProductSetupFlow()
-    await setup_flow.kickoff()
+    await setup_flow.kickoff_async()
 
     print(f"   Created {len(setup_flow.state.products)} products:")
     for product in setup_flow.state.products.values():
         print(f"   - {product.name}: ${product.base_cpm:.2f} CPM")
 
-    # Step 2: Process a discovery query (anonymous)
-    print("\n2. Processing discovery query (anonymous)...")
-    discovery_flow = DiscoveryInquiryFlow()
-    discovery_flow.state.query = "What CTV inventory do you have?"
-    discovery_flow.state.products = setup_flow.state.products
-    discovery_flow.kickoff()
-
-    print(f"   Access tier: {discovery_flow.state.response_data.get('access_tier', 'public')}")
-
-    # Step 3: Process discovery with agency identity
-    print("\n3. Processing discovery query (agency tier)...")
+    # Steps 2 and 3 are independent queries, so run both discovery flows concurrently
     agency_identity = BuyerIdentity(
         agency_id="agency-123",
         agency_name="Test Agency",
@@ -55,12 +52,23 @@ async def main():
         is_authenticated=True,
     )
 
+    discovery_flow = DiscoveryInquiryFlow()
+    discovery_flow.state.query = "What CTV inventory do you have?"
+    discovery_flow.state.products = setup_flow.state.products
+
     discovery_flow2 = DiscoveryInquiryFlow()
     discovery_flow2.state.query = "What is the pricing for CTV?"
     discovery_flow2.state.buyer_context = agency_context
     discovery_flow2.state.products = setup_flow.state.products
-    discovery_flow2.kickoff()
 
+    await asyncio.gather(discovery_flow.kickoff_async(), discovery_flow2.kickoff_async())
+
+    # Step 2: Process a discovery query (anonymous)
+    print("\n2. Processing discovery query (anonymous)...")
+    print(f"   Access tier: {discovery_flow.state.response_data.get('access_tier', 'public')}")
+
+    # Step 3: Process discovery with agency identity
+    print("\n3. Processing discovery query (agency tier)...")
     if "pricing" in discovery_flow2.state.response_data:
         pricing = discovery_flow2.state.response_data["pricing"]
         print(f"   Agency tier discount: {pricing.get('discount_from_msrp', 'N/A')}")
@@ -68,7 +76,7 @@ async def main():
     # Step 4: Submit a proposal
     print("\n4. Submitting a proposal...")
     proposal_data = {
-        "product_id": list(setup_flow.state.products.keys())[0],  # First product
+        "product_id": next(iter(setup_flow.state.products)),  # First product
         "deal_type": "preferred_deal",
         "price": 12.0,
         "impressions": 1000000,
@@ -76,8 +84,11 @@ async def main():
         "end_date": "2026-03-31",
     }
 
+    # handle_proposal and generate_deal call the synchronous kickoff(), which
+    # starts its own event loop, so run them off this one
     proposal_flow = ProposalHandlingFlow()
-    result = proposal_flow.handle_proposal(
+    result = await asyncio.to_thread(
+        proposal_flow.handle_proposal,
         proposal_id="prop-001",
         proposal_data=proposal_data,
         buyer_context=agency_context,
@@ -92,7 +103,8 @@ async def main():
         print("\n5. Generating deal...")
 
         deal_flow = DealGenerationFlow()
-        deal_result = deal_flow.generate_deal(
+        deal_result = await asyncio.to_thread(
+            deal_flow.generate_deal,
             proposal_id="prop-001",
             proposal_data={
                 **proposal_data,
@@ -115,4 +127,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
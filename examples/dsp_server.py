@@ -18,116 +18,181 @@ Usage:
     cd ad_seller_system/examples
     python dsp_server.py
 
-Runs on port 8002
+Runs on port 8002 (set DSP_WORKERS=N for N worker processes)
 """
 
 import asyncio
+import bisect
+import functools
+import importlib.util
 import json
+import os
 import sys
-import uuid
-from datetime import datetime
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Optional
 
-# Load .env from project root (so script works from any directory)
-from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path)
-
-# Rich console for beautiful output
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
 # FastAPI for HTTP server
 try:
     from fastapi import FastAPI, Request
-    from fastapi.responses import JSONResponse
-    import uvicorn
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import ORJSONResponse, Response
+    import orjson
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
-    print("Error: Please install FastAPI: pip install fastapi uvicorn")
+    print("Error: Please install FastAPI: pip install fastapi uvicorn orjson")
     sys.exit(1)
 
-console = Console() if RICH_AVAILABLE else None
+# uvloop/httptools (shipped with uvicorn[standard]) for a faster event loop and HTTP parser
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+HTTPTOOLS_AVAILABLE = importlib.util.find_spec("httptools") is not None
+
+# Optional CBOR encoding for clients that send "Accept: application/cbor"
+try:
+    import cbor2
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+
+# Helpers shared with publisher_gam_server live next to this file. Rich (behind
+# get_console), uvicorn and python-dotenv are imported on first use rather than
+# here, so importing the app (tests, workers, health-check boots) stays cheap
+sys.path.insert(0, str(Path(__file__).parent))
+from server_common import (
+    USE_RICH,
+    ActivityLog,
+    cached_response,
+    clock_now,
+    etag_for,
+    get_console,
+    iso_now,
+    new_id,
+)
+
+
+def load_env() -> None:
+    """Load .env from project root (so script works from any directory)."""
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent.parent / ".env")
+
 
 # =============================================================================
 # DSP Inventory (Performance & Mobile focused)
 # =============================================================================
 
+# Static product catalog, shared by every DSPInventory and never mutated
+DSP_PRODUCTS = (
+    {
+        "id": "perf-display-001",
+        "name": "Performance Display - ComScore Top 200",
+        "channel": "display",
+        "type": "performance",
+        "base_cpm": 8.00,
+        "floor_cpm": 4.00,
+        "available_impressions": 500_000_000,
+        "targeting_options": ["behavioral", "contextual", "retargeting", "lookalike"],
+        "ad_formats": ["300x250", "728x90", "160x600", "320x50"],
+        "optimization_goals": ["conversions", "clicks", "viewability"],
+    },
+    {
+        "id": "perf-display-002",
+        "name": "Performance Display - Premium Properties",
+        "channel": "display",
+        "type": "performance",
+        "base_cpm": 12.00,
+        "floor_cpm": 8.00,
+        "available_impressions": 200_000_000,
+        "targeting_options": ["purchase_intent", "in_market", "retargeting"],
+        "ad_formats": ["300x250", "728x90", "970x250"],
+        "optimization_goals": ["conversions", "roas", "sales"],
+    },
+    {
+        "id": "mobile-app-001",
+        "name": "Mobile App Install - Premium Network",
+        "channel": "mobile",
+        "type": "app_install",
+        "base_cpi": 3.50,  # Cost per install
+        "floor_cpi": 2.00,
+        "available_installs": 5_000_000,
+        "targeting_options": ["device", "behavioral", "lookalike", "geo"],
+        "ad_formats": ["interstitial", "rewarded", "native", "banner"],
+        "optimization_goals": ["installs", "post_install_events", "retention"],
+    },
+    {
+        "id": "mobile-app-002",
+        "name": "Mobile App Engagement - Deep Link",
+        "channel": "mobile",
+        "type": "app_engagement",
+        "base_cpm": 6.00,
+        "floor_cpm": 3.00,
+        "available_impressions": 100_000_000,
+        "targeting_options": ["app_users", "lapsed_users", "high_value"],
+        "ad_formats": ["native", "interstitial"],
+        "optimization_goals": ["app_opens", "in_app_events", "purchases"],
+    },
+)
+
+
 class DSPInventory:
     """DSP inventory and campaign management."""
 
+    __slots__ = (
+        "dsp_name",
+        "dsp_id",
+        "products",
+        "products_by_id",
+        "products_by_channel",
+        "product_pricing",
+        "product_listings",
+        "product_listing_json",
+        "campaigns",
+        "attached_deals",
+        "deals_by_campaign",
+        "request_log",
+    )
+
     def __init__(self):
         self.dsp_name = "DSP"
         self.dsp_id = "generic-dsp"
 
-        # Performance Display Products
-        self.products = [
-            {
-                "id": "perf-display-001",
-                "name": "Performance Display - ComScore Top 200",
-                "channel": "display",
-                "type": "performance",
-                "base_cpm": 8.00,
-                "floor_cpm": 4.00,
-                "available_impressions": 500_000_000,
-                "targeting_options": ["behavioral", "contextual", "retargeting", "lookalike"],
-                "ad_formats": ["300x250", "728x90", "160x600", "320x50"],
-                "optimization_goals": ["conversions", "clicks", "viewability"],
-            },
-            {
-                "id": "perf-display-002",
-                "name": "Performance Display - Premium Properties",
-                "channel": "display",
-                "type": "performance",
-                "base_cpm": 12.00,
-                "floor_cpm": 8.00,
-                "available_impressions": 200_000_000,
-                "targeting_options": ["purchase_intent", "in_market", "retargeting"],
-                "ad_formats": ["300x250", "728x90", "970x250"],
-                "optimization_goals": ["conversions", "roas", "sales"],
-            },
-            {
-                "id": "mobile-app-001",
-                "name": "Mobile App Install - Premium Network",
-                "channel": "mobile",
-                "type": "app_install",
-                "base_cpi": 3.50,  # Cost per install
-                "floor_cpi": 2.00,
-                "available_installs": 5_000_000,
-                "targeting_options": ["device", "behavioral", "lookalike", "geo"],
-                "ad_formats": ["interstitial", "rewarded", "native", "banner"],
-                "optimization_goals": ["installs", "post_install_events", "retention"],
-            },
-            {
-                "id": "mobile-app-002",
-                "name": "Mobile App Engagement - Deep Link",
-                "channel": "mobile",
-                "type": "app_engagement",
-                "base_cpm": 6.00,
-                "floor_cpm": 3.00,
-                "available_impressions": 100_000_000,
-                "targeting_options": ["app_users", "lapsed_users", "high_value"],
-                "ad_formats": ["native", "interstitial"],
-                "optimization_goals": ["app_opens", "in_app_events", "purchases"],
-            },
-        ]
+        self.products = DSP_PRODUCTS
+
+        # Lookup indexes over the (static) product catalog
+        self.products_by_id = {p["id"]: p for p in self.products}
+        self.products_by_channel = {
+            channel: tuple(p for p in self.products if p["channel"] == channel)
+            for channel in {p["channel"] for p in self.products}
+        }
+        # Product ID -> (base price, pricing model); CPI products carry
+        # base_cpi instead of base_cpm
+        self.product_pricing = {
+            p["id"]: (p["base_cpi"], "CPI") if "base_cpi" in p else (p.get("base_cpm", 0), "CPM")
+            for p in self.products
+        }
+
+        # list_products results are fixed, so build them once and share them
+        self.product_listings = {
+            channel: {"dsp": self.dsp_name, "products": products, "total": len(products)}
+            for channel, products in {None: self.products, **self.products_by_channel}.items()
+        }
+        self.product_listing_json = {
+            channel: orjson.dumps(listing) for channel, listing in self.product_listings.items()
+        }
 
         # Track campaigns and attached deals
         self.campaigns = {}
         self.attached_deals = {}  # Deal IDs from publishers
-        self.request_log = []
+        self.deals_by_campaign = defaultdict(dict)  # campaign_id -> {deal_id: deal}
+        self.request_log = deque(maxlen=10_000)  # Bounded for long-running servers
 
 
 class DSPPricingEngine:
     """Calculate DSP campaign pricing."""
 
+    __slots__ = ()
+
     TIER_DISCOUNTS = {
         "public": 0,
         "seat": 3,
@@ -135,29 +200,46 @@ class DSPPricingEngine:
         "advertiser": 12,
     }
 
+    # Ascending volume thresholds; _VOLUME_RATES[i] applies when volume clears
+    # exactly i of them
+    _VOLUME_THRESHOLDS = (10_000_000, 50_000_000, 100_000_000)
+    _VOLUME_RATES = (0, 4, 7, 10)
+
+    @classmethod
+    def volume_discount(cls, volume: int) -> int:
+        """Volume discount percentage for an impression count."""
+        return cls._VOLUME_RATES[bisect.bisect_right(cls._VOLUME_THRESHOLDS, volume)]
+
     @classmethod
     def calculate_price(cls, base_price: float, buyer_tier: str, volume: int) -> dict:
-        tier_discount = cls.TIER_DISCOUNTS.get(buyer_tier.lower(), 0)
+        # _price_breakdown is memoized on the 0/4/7/10% discount, so every
+        # volume within a tier shares one entry
+        volume_discount = cls.volume_discount(volume)
+        return dict(cls._price_breakdown(base_price, buyer_tier.lower(), volume_discount))
 
-        # Volume discounts for DSP
-        volume_discount = 0
-        if volume >= 100_000_000:
-            volume_discount = 10
-        elif volume >= 50_000_000:
-            volume_discount = 7
-        elif volume >= 10_000_000:
-            volume_discount = 4
+    @classmethod
+    def calculate_prices(cls, base_prices: list[float], buyer_tier: str, volume: int) -> list[dict]:
+        """Price several products for one buyer tier and volume in a single pass."""
+        tier = buyer_tier.lower()
+        volume_discount = cls.volume_discount(volume)
+        return [dict(cls._price_breakdown(price, tier, volume_discount)) for price in base_prices]
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _price_breakdown(cls, base_price: float, buyer_tier: str, volume_discount: int) -> tuple:
+        """Memoized pricing as an immutable tuple of (key, value) pairs."""
+        tier_discount = cls.TIER_DISCOUNTS.get(buyer_tier, 0)
 
         total_discount = tier_discount + volume_discount
         final_price = base_price * (1 - total_discount / 100)
 
-        return {
-            "base_price": base_price,
-            "tier_discount": tier_discount,
-            "volume_discount": volume_discount,
-            "total_discount": total_discount,
-            "final_price": round(final_price, 2),
-        }
+        return (
+            ("base_price", base_price),
+            ("tier_discount", tier_discount),
+            ("volume_discount", volume_discount),
+            ("total_discount", total_discount),
+            ("final_price", round(final_price, 2)),
+        )
 
 
 # Global state
@@ -195,6 +277,18 @@ MCP_TOOLS = [
             "required": ["product_id"]
         }
     },
+    {
+        "name": "get_bulk_pricing",
+        "description": "Get pricing for several DSP products at once (all products if none given)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "product_ids": {"type": "array", "items": {"type": "string"}},
+                "buyer_tier": {"type": "string"},
+                "volume": {"type": "integer"}
+            }
+        }
+    },
     {
         "name": "attach_deal",
         "description": "Attach a publisher Deal ID (from PMP) to a DSP campaign",
@@ -271,42 +365,58 @@ MCP_TOOLS = [
     }
 ]
 
+# Static payloads are encoded once at import instead of on every request
+TOOLS_JSON = orjson.dumps({"tools": MCP_TOOLS})
+TOOLS_CBOR = cbor2.dumps({"tools": MCP_TOOLS}) if CBOR_AVAILABLE else None
+ROOT_JSON = orjson.dumps({
+    "name": "DSP Seller Agent",
+    "dsp": inventory.dsp_name,
+    "port": 8002,
+    "capabilities": ["deal_attachment", "performance_display", "mobile_app"],
+})
+TOOLS_ETAG = etag_for(TOOLS_JSON)
+TOOLS_CBOR_ETAG = etag_for(TOOLS_CBOR) if CBOR_AVAILABLE else None
+
 # =============================================================================
 # Logging
 # =============================================================================
 
+# Set DSP_LOG_VERBOSE=false to keep the activity log in memory only
+LOG_VERBOSE = os.getenv("DSP_LOG_VERBOSE", "true").lower() != "false"
+
+activity_log = ActivityLog("dsp_server.activity", {
+    "MCP": "[cyan]MCP[/cyan]",
+    "DSP": "[yellow]DSP[/yellow]",
+})
+
+
 def log_event(source: str, message: str):
     """Log an event with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+    timestamp = clock_now()
     entry = {"timestamp": timestamp, "source": source, "message": message}
     inventory.request_log.append(entry)
 
-    if RICH_AVAILABLE:
-        color = "cyan" if source == "MCP" else "yellow" if source == "DSP" else "green"
-        console.print(f"[dim]{timestamp}[/dim] [{color}]{source}[/{color}] → {message}")
-    else:
-        print(f"{timestamp} [{source}] {message}")
+    if LOG_VERBOSE:
+        activity_log.log(timestamp, source, message)
 
 
 # =============================================================================
 # MCP Tool Handlers
 # =============================================================================
 
-def handle_list_products(args: dict) -> dict:
+def handle_list_products(args: dict) -> dict | bytes:
     """Handle list_products tool call."""
-    channel = args.get("channel")
+    channel = args.get("channel") or None
 
-    products = inventory.products
-    if channel:
-        products = [p for p in products if p["channel"] == channel]
+    listing = inventory.product_listings.get(channel)
+    if listing is None:
+        log_event("MCP", "list_products → 0 products")
+        return {"dsp": inventory.dsp_name, "products": [], "total": 0}
 
-    log_event("MCP", f"list_products → {len(products)} products")
+    log_event("MCP", f"list_products → {listing['total']} products")
 
-    return {
-        "dsp": inventory.dsp_name,
-        "products": products,
-        "total": len(products),
-    }
+    # Known listings go out as the JSON encoded at startup
+    return inventory.product_listing_json[channel]
 
 
 def handle_get_pricing(args: dict) -> dict:
@@ -315,12 +425,12 @@ def handle_get_pricing(args: dict) -> dict:
     buyer_tier = args.get("buyer_tier", "public")
     volume = args.get("volume", 0)
 
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
+    product = inventory.products_by_id.get(product_id)
     if not product:
         return {"error": f"Product {product_id} not found"}
 
     # Get base price (CPM or CPI depending on product)
-    base_price = product.get("base_cpm", product.get("base_cpi", 0))
+    base_price, pricing_model = inventory.product_pricing[product_id]
 
     pricing = pricing_engine.calculate_price(base_price, buyer_tier, volume)
 
@@ -329,11 +439,51 @@ def handle_get_pricing(args: dict) -> dict:
     return {
         "product_id": product_id,
         "product_name": product["name"],
-        "pricing_model": "CPI" if "cpi" in str(product.keys()) else "CPM",
+        "pricing_model": pricing_model,
         "pricing": pricing,
     }
 
 
+def handle_get_bulk_pricing(args: dict) -> dict:
+    """Handle get_bulk_pricing tool call."""
+    product_ids = args.get("product_ids")
+    # A bare string would otherwise be iterated as one-character IDs
+    if product_ids is not None and (
+        not isinstance(product_ids, list) or not all(isinstance(pid, str) for pid in product_ids)
+    ):
+        return {"error": "product_ids must be a list of product ID strings"}
+    product_ids = product_ids or [p["id"] for p in inventory.products]
+    buyer_tier = args.get("buyer_tier", "public")
+    volume = args.get("volume", 0)
+
+    missing = [pid for pid in product_ids if pid not in inventory.products_by_id]
+    if missing:
+        return {"error": f"Products not found: {', '.join(missing)}"}
+
+    products = [inventory.products_by_id[pid] for pid in product_ids]
+    bases = [inventory.product_pricing[pid] for pid in product_ids]
+    prices = pricing_engine.calculate_prices(
+        [base_price for base_price, _ in bases], buyer_tier, volume
+    )
+
+    log_event("MCP", f"get_bulk_pricing → {len(products)} products ({buyer_tier})")
+
+    return {
+        "buyer_tier": buyer_tier,
+        "volume": volume,
+        "quotes": [
+            {
+                "product_id": product["id"],
+                "product_name": product["name"],
+                "pricing_model": pricing_model,
+                "pricing": pricing,
+            }
+            for product, (_, pricing_model), pricing in zip(products, bases, prices)
+        ],
+        "total": len(products),
+    }
+
+
 def handle_attach_deal(args: dict) -> dict:
     """Attach a publisher Deal ID to a DSP campaign."""
     deal_id = args.get("deal_id")
@@ -346,7 +496,7 @@ def handle_attach_deal(args: dict) -> dict:
 
     # Create campaign if not provided
     if not campaign_id:
-        campaign_id = f"DSP-CAMP-{uuid.uuid4().hex[:8].upper()}"
+        campaign_id = f"DSP-CAMP-{new_id()}"
 
         campaign = {
             "campaign_id": campaign_id,
@@ -358,18 +508,24 @@ def handle_attach_deal(args: dict) -> dict:
             "end_date": end_date,
             "status": "ACTIVE",
             "attached_deals": [deal_id],
-            "created_at": datetime.now().isoformat(),
+            "created_at": iso_now(),
         }
         inventory.campaigns[campaign_id] = campaign
         log_event("DSP", f"Created Campaign: {campaign_id}")
 
-    # Attach deal
-    inventory.attached_deals[deal_id] = {
+    # Attach deal (re-attaching moves it off its previous campaign)
+    previous = inventory.attached_deals.get(deal_id)
+    if previous:
+        inventory.deals_by_campaign[previous["campaign_id"]].pop(deal_id, None)
+
+    deal = {
         "deal_id": deal_id,
         "campaign_id": campaign_id,
         "status": "ACTIVE",
-        "attached_at": datetime.now().isoformat(),
+        "attached_at": iso_now(),
     }
+    inventory.attached_deals[deal_id] = deal
+    inventory.deals_by_campaign[campaign_id][deal_id] = deal
 
     log_event("DSP", f"Attached Deal: {deal_id} → Campaign {campaign_id}")
 
@@ -394,12 +550,12 @@ def handle_create_performance_campaign(args: dict) -> dict:
     start_date = args.get("start_date", "2026-03-01")
     end_date = args.get("end_date", "2026-06-30")
 
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
+    product = inventory.products_by_id.get(product_id)
     if not product:
         return {"error": f"Product {product_id} not found"}
 
-    campaign_id = f"DSP-PERF-{uuid.uuid4().hex[:8].upper()}"
-    line_id = f"DSP-LINE-{uuid.uuid4().hex[:8].upper()}"
+    campaign_id = f"DSP-PERF-{new_id()}"
+    line_id = f"DSP-LINE-{new_id()}"
 
     campaign = {
         "campaign_id": campaign_id,
@@ -423,7 +579,7 @@ def handle_create_performance_campaign(args: dict) -> dict:
                 "status": "ACTIVE",
             }
         ],
-        "created_at": datetime.now().isoformat(),
+        "created_at": iso_now(),
     }
 
     inventory.campaigns[campaign_id] = campaign
@@ -450,11 +606,11 @@ def handle_create_mobile_campaign(args: dict) -> dict:
     start_date = args.get("start_date", "2026-03-01")
     end_date = args.get("end_date", "2026-06-30")
 
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
+    product = inventory.products_by_id.get(product_id)
     if not product:
         return {"error": f"Product {product_id} not found"}
 
-    campaign_id = f"DSP-MOBILE-{uuid.uuid4().hex[:8].upper()}"
+    campaign_id = f"DSP-MOBILE-{new_id()}"
 
     campaign = {
         "campaign_id": campaign_id,
@@ -473,7 +629,7 @@ def handle_create_mobile_campaign(args: dict) -> dict:
         "start_date": start_date,
         "end_date": end_date,
         "status": "ACTIVE",
-        "created_at": datetime.now().isoformat(),
+        "created_at": iso_now(),
     }
 
     inventory.campaigns[campaign_id] = campaign
@@ -496,79 +652,120 @@ def handle_get_campaign_status(args: dict) -> dict:
 
     return {
         "campaign": campaign,
-        "attached_deals": [
-            d for d in inventory.attached_deals.values()
-            if d.get("campaign_id") == campaign_id
-        ]
+        "attached_deals": list(inventory.deals_by_campaign.get(campaign_id, {}).values()),
     }
 
 
 TOOL_HANDLERS = {
     "list_products": handle_list_products,
     "get_pricing": handle_get_pricing,
+    "get_bulk_pricing": handle_get_bulk_pricing,
     "attach_deal": handle_attach_deal,
     "create_performance_campaign": handle_create_performance_campaign,
     "create_mobile_campaign": handle_create_mobile_campaign,
     "get_campaign_status": handle_get_campaign_status,
 }
 
+# Success envelopes are the same for every call to a tool, so generate each
+# tool's b'{"success":true,"tool":"<name>","result":' prefix once and splice
+# the encoded result in per request
+RESULT_PREFIXES = {
+    name: orjson.dumps({"success": True, "tool": name, "result": None})[:-len(b"null}")]
+    for name in TOOL_HANDLERS
+}
+
 # =============================================================================
 # FastAPI Application
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the activity-log listener for the lifetime of each server process."""
+    activity_log.start()
+    try:
+        yield
+    finally:
+        activity_log.stop()
+
+
 app = FastAPI(
     title="DSP Seller Agent",
     description="DSP for Performance and Mobile campaigns",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Product lists and campaign status payloads are repetitive JSON; compress
+# anything over 1 KB at the fastest level and leave small responses alone
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+
+def wants_cbor(request: Request) -> bool:
+    """Whether the client asked for CBOR and we can produce it."""
+    return CBOR_AVAILABLE and "application/cbor" in request.headers.get("accept", "")
+
+
+def mcp_response(request: Request, payload: dict) -> Response:
+    """Encode an MCP payload as CBOR or JSON depending on the Accept header."""
+    if wants_cbor(request):
+        return Response(content=cbor2.dumps(payload), media_type="application/cbor")
+    return ORJSONResponse(payload)
+
+
+def tool_result_response(request: Request, tool_name: str, result: dict | bytes) -> Response:
+    """Wrap a tool result (a dict, or pre-encoded JSON bytes) in the /mcp/call success envelope."""
+    if wants_cbor(request):
+        if isinstance(result, bytes):
+            result = orjson.loads(result)
+        return mcp_response(request, {"success": True, "tool": tool_name, "result": result})
+    if not isinstance(result, bytes):
+        result = orjson.dumps(result)
+    content = b"".join((RESULT_PREFIXES[tool_name], result, b"}"))
+    return Response(content=content, media_type="application/json")
+
 
 @app.get("/")
 async def root():
-    return {
-        "name": "DSP Seller Agent",
-        "dsp": inventory.dsp_name,
-        "port": 8002,
-        "capabilities": ["deal_attachment", "performance_display", "mobile_app"]
-    }
+    return Response(content=ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": iso_now()}
 
 
 @app.get("/mcp/tools")
-async def list_tools():
-    return {"tools": MCP_TOOLS}
+async def list_tools(request: Request):
+    # The body depends on Accept (JSON or CBOR), so caches must key on it
+    if wants_cbor(request):
+        return cached_response(request, TOOLS_CBOR, TOOLS_CBOR_ETAG, "application/cbor", vary="Accept")
+    return cached_response(request, TOOLS_JSON, TOOLS_ETAG, vary="Accept")
 
 
-@app.post("/mcp/call")
+@app.post("/mcp/call", response_class=ORJSONResponse)
 async def call_tool(request: Request):
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         tool_name = body.get("name")
         arguments = body.get("arguments", {})
 
-        if tool_name not in TOOL_HANDLERS:
-            return {"success": False, "error": f"Tool '{tool_name}' not found"}
+        handler = TOOL_HANDLERS.get(tool_name)
+        if handler is None:
+            return mcp_response(request, {"success": False, "error": f"Tool '{tool_name}' not found"})
 
-        handler = TOOL_HANDLERS[tool_name]
         result = handler(arguments)
 
-        return {"success": True, "tool": tool_name, "result": result}
+        return tool_result_response(request, tool_name, result)
     except Exception as e:
-        return {"success": False, "error": str(e)}
+        return mcp_response(request, {"success": False, "error": str(e)})
 
 
 # =============================================================================
 # Main
 # =============================================================================
 
-def print_banner():
-    """Print server banner."""
-    if RICH_AVAILABLE:
-        banner = """
+BANNER = """\
 ╔══════════════════════════════════════════════════════════════╗
 ║              DSP SELLER AGENT                         ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -583,6 +780,7 @@ def print_banner():
 ║  MCP Tools:                                                  ║
 ║    • list_products                                           ║
 ║    • get_pricing                                             ║
+║    • get_bulk_pricing                                        ║
 ║    • attach_deal           → Attach PMP Deal ID              ║
 ║    • create_performance_campaign                             ║
 ║    • create_mobile_campaign                                  ║
@@ -591,24 +789,60 @@ def print_banner():
 ║  Waiting for buyer agent connections...                      ║
 ╚══════════════════════════════════════════════════════════════╝
 """
-        console.print(Panel(banner.strip(), style="bold yellow"))
+
+PLAIN_BANNER = "\n".join([
+    "",
+    "=" * 60,
+    "DSP SELLER AGENT",
+    "=" * 60,
+    "Port: 8002",
+    "=" * 60,
+    "",
+])
+
+
+def print_banner():
+    """Print server banner."""
+    if USE_RICH:
+        # The banner draws its own box, so skip Panel's layout pass
+        get_console().print(BANNER, style="bold yellow", end="")
     else:
-        print("\n" + "=" * 60)
-        print("DSP SELLER AGENT")
-        print("=" * 60)
-        print("Port: 8002")
-        print("=" * 60 + "\n")
+        print(PLAIN_BANNER)
 
 
 def main():
     """Run the DSP MCP server."""
+    global LOG_VERBOSE
+
+    import uvicorn
+
+    # .env may override DSP_LOG_VERBOSE, so re-read it once loaded
+    load_env()
+    LOG_VERBOSE = os.getenv("DSP_LOG_VERBOSE", "true").lower() != "false"
+
     print_banner()
 
-    if RICH_AVAILABLE:
+    if USE_RICH:
+        console = get_console()
         console.print("\n[bold green]Starting server...[/bold green]\n")
         console.print("[dim]Activity log:[/dim]\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=8002, log_level="warning")
+    # Campaigns and attached deals live in process memory, so each worker has
+    # its own copy; only raise DSP_WORKERS when that is acceptable
+    workers = int(os.getenv("DSP_WORKERS", "1"))
+
+    uvicorn.run(
+        "dsp_server:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8002,
+        log_level="warning",
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+        workers=workers,
+        backlog=2048,
+        timeout_keep_alive=30,
+        limit_concurrency=1000,
+    )
 
 
 if __name__ == "__main__":
@@ -8,6 +8,13 @@ via MCP (Model Context Protocol) for OpenDirect 2.1 operations.
 """
 
 import asyncio
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from ad_seller.clients import UnifiedClient, Protocol
 
 
@@ -28,9 +35,14 @@ async def main():
         ) as client:
             print("Connected successfully!\n")
 
+            # Both listings are read-only and independent, so fetch them concurrently
+            orgs_result, products_result = await asyncio.gather(
+                client.list_organizations(),
+                client.list_products(),
+            )
+
             # List organizations
             print("1. Listing organizations...")
-            orgs_result = await client.list_organizations()
             if orgs_result.success:
                 orgs = orgs_result.data or []
                 print(f"   Found {len(orgs)} organizations")
@@ -41,7 +53,6 @@ async def main():
 
             # List products
             print("\n2. Listing products...")
-            products_result = await client.list_products()
             if products_result.success:
                 products = products_result.data or []
                 print(f"   Found {len(products)} products")
@@ -70,4 +81,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
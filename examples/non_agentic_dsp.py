@@ -12,28 +12,25 @@ The seller agent:
 3. Provides activation instructions for the DSP
 """
 
+import asyncio
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from ad_seller.flows import NonAgenticDSPFlow
 from ad_seller.models.buyer_identity import BuyerContext, BuyerIdentity
 
 
-def main():
+async def main():
     """Run non-agentic DSP workflow example."""
     print("=" * 60)
     print("Non-Agentic DSP Workflow Example")
     print("=" * 60)
 
-    # Scenario 1: Anonymous inquiry
-    print("\n1. Anonymous inquiry (public tier)...")
-    flow1 = NonAgenticDSPFlow()
-    result1 = flow1.process_request(
-        request_text="What CTV inventory do you have available?",
-        buyer_context=None,
-    )
-    print(f"   Response type: {result1['request_type']}")
-    print(f"   Status: {result1['status']}")
-
     # Scenario 2: Agency-authenticated deal request
-    print("\n2. Agency deal request...")
     agency_identity = BuyerIdentity(
         agency_id="agency-wpp-123",
         agency_name="GroupM",
@@ -44,22 +41,7 @@ def main():
         is_authenticated=True,
     )
 
-    flow2 = NonAgenticDSPFlow()
-    result2 = flow2.process_request(
-        request_text="I want to create a CTV deal for 5 million impressions",
-        buyer_context=agency_context,
-    )
-
-    print(result2["response"])
-
-    if result2.get("deal"):
-        deal = result2["deal"]
-        print(f"\n   Deal created successfully!")
-        print(f"   Deal ID: {deal['deal_id']}")
-        print(f"   Price: ${deal['price']:.2f} CPM")
-
     # Scenario 3: Advertiser-level pricing
-    print("\n3. Advertiser-level deal request (best pricing)...")
     advertiser_identity = BuyerIdentity(
         agency_id="agency-wpp-123",
         agency_name="GroupM",
@@ -71,17 +53,8 @@ def main():
         is_authenticated=True,
     )
 
-    flow3 = NonAgenticDSPFlow()
-    result3 = flow3.process_request(
-        request_text="Create a preferred deal for video inventory",
-        buyer_context=advertiser_context,
-    )
-
-    print(result3["response"])
-
     # Scenario 4: Same advertiser through different agency
     # (demonstrates cross-agency pricing consistency)
-    print("\n4. Same advertiser via different agency...")
     different_agency_identity = BuyerIdentity(
         agency_id="agency-omnicom-456",
         agency_name="OMD",
@@ -93,13 +66,47 @@ def main():
         is_authenticated=True,
     )
 
-    flow4 = NonAgenticDSPFlow()
-    result4 = flow4.process_request(
-        request_text="What's the pricing for video?",
-        buyer_context=different_agency_context,
-    )
+    # The scenarios are independent, so run them concurrently. Each gets its
+    # own flow because a run keeps its working data in the flow state.
+    async with asyncio.TaskGroup() as tg:
+        task1 = tg.create_task(NonAgenticDSPFlow().aprocess_request(
+            request_text="What CTV inventory do you have available?",
+            buyer_context=None,
+        ))
+        task2 = tg.create_task(NonAgenticDSPFlow().aprocess_request(
+            request_text="I want to create a CTV deal for 5 million impressions",
+            buyer_context=agency_context,
+        ))
+        task3 = tg.create_task(NonAgenticDSPFlow().aprocess_request(
+            request_text="Create a preferred deal for video inventory",
+            buyer_context=advertiser_context,
+        ))
+        task4 = tg.create_task(NonAgenticDSPFlow().aprocess_request(
+            request_text="What's the pricing for video?",
+            buyer_context=different_agency_context,
+        ))
 
-    print(result4["response"])
+    # Scenario 1: Anonymous inquiry
+    print("\n1. Anonymous inquiry (public tier)...")
+    result1 = task1.result()
+    print(f"   Response type: {result1['request_type']}")
+    print(f"   Status: {result1['status']}")
+
+    print("\n2. Agency deal request...")
+    result2 = task2.result()
+    print(result2["response"])
+
+    if result2.get("deal"):
+        deal = result2["deal"]
+        print(f"\n   Deal created successfully!")
+        print(f"   Deal ID: {deal['deal_id']}")
+        print(f"   Price: ${deal['price']:.2f} CPM")
+
+    print("\n3. Advertiser-level deal request (best pricing)...")
+    print(task3.result()["response"])
+
+    print("\n4. Same advertiser via different agency...")
+    print(task4.result()["response"])
     print("\n   Note: Same advertiser gets consistent pricing regardless of agency!")
 
     print("\n" + "=" * 60)
@@ -107,4 +114,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -18,48 +18,68 @@ Usage:
     cd ad_seller_system/examples
     python publisher_gam_server.py
 
-Runs on port 8001
+Runs on port 8001 (set PUBLISHER_WORKERS=N for N worker processes)
 
 LIVE GAM INTEGRATION: This server connects to real Google Ad Manager!
 """
 
 import asyncio
-import json
+import bisect
+import functools
+import importlib.util
+import itertools
 import os
 import sys
-import uuid
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
-# Add parent directory to path for ad_seller imports
+# Add parent directory to path for ad_seller imports, and this directory for
+# the helpers shared with dsp_server
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
 
 # Load .env from project root (so script works from any directory)
 from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
-# Rich console for beautiful output
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
 # FastAPI for HTTP server
 try:
     from fastapi import FastAPI, Request
-    from fastapi.responses import JSONResponse
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import ORJSONResponse, Response
+    import orjson
     import uvicorn
+    from pydantic import BaseModel
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
-    print("Error: Please install FastAPI: pip install fastapi uvicorn")
+    print("Error: Please install FastAPI: pip install fastapi uvicorn orjson")
     sys.exit(1)
 
+# Shared server helpers; get_console() imports Rich on first use, not at startup
+from server_common import (
+    USE_RICH,
+    ActivityLog,
+    cached_response,
+    clock_now,
+    etag_for,
+    get_console,
+    iso_now,
+    new_id,
+    stamp_now,
+)
+
+# uvicorn[standard] installs uvloop and httptools; main() hands them to uvicorn when present
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+HTTPTOOLS_AVAILABLE = importlib.util.find_spec("httptools") is not None
+
 # Import real GAM clients
 try:
     from ad_seller.clients import GAMSoapClient, GAMRestClient
@@ -81,15 +101,159 @@ except ImportError as e:
     print(f"Warning: GAM integration not available: {e}")
     print("Running in simulation mode.")
 
-console = Console() if RICH_AVAILABLE else None
-
 # =============================================================================
 # Publisher Inventory (CTV focused)
 # =============================================================================
 
+class TTLCache:
+    """Small time-bounded cache for pre-encoded tool results.
+
+    Entries expire ``ttl`` seconds after they are stored; once ``maxsize`` is
+    reached the oldest entry is evicted to make room.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict = {}
+
+    def get(self, key) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value) -> None:
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+@dataclass(slots=True)
+class Product:
+    """A CTV product; field order is the list_products JSON order."""
+
+    id: str
+    name: str
+    channel: str
+    publisher: str
+    inventory_type: str
+    base_cpm: float
+    floor_cpm: float
+    available_impressions: int
+    targeting_options: list[str]
+    ad_formats: list[str]
+    supported_deal_types: list[str]
+    gam_ad_unit_id: Optional[str] = None  # Set during GAM initialization
+    gam_ad_unit_name: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class GAMBooking:
+    """A PG booking: the GAM order, its line items and the approval result."""
+
+    order: dict
+    line_items: list
+    approval: dict
+
+
+@dataclass(slots=True, frozen=True)
+class PMPDeal:
+    """A PMP deal as stored by the publisher.
+
+    Only the per-deal values are kept; the OpenRTB and DSP activation blocks
+    are derived in to_dict() when the deal is sent to a buyer.
+    """
+
+    deal_id: str
+    product_id: str
+    product_name: str
+    publisher: str
+    gam_ad_unit_id: Optional[str]
+    floor_price: float
+    impressions_estimate: int
+    start_date: str
+    end_date: str
+    advertiser_name: str
+    agency_name: str
+    buyer_seat_id: str
+    target_dsp: str
+    created_at: str
+    gam_network_code: str
+
+    def to_dict(self) -> dict:
+        dsp_config = DSP_CONFIGS.get(self.target_dsp, DSP_CONFIGS["generic_dsp"])
+        return {
+            "deal_id": self.deal_id,
+            "deal_type": "private_marketplace",
+            "product_id": self.product_id,
+            "product_name": self.product_name,
+            "publisher": self.publisher,
+            "gam_ad_unit_id": self.gam_ad_unit_id,
+            "floor_price": self.floor_price,
+            "auction_type": "first_price",
+            "impressions_estimate": self.impressions_estimate,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "advertiser_name": self.advertiser_name,
+            "agency_name": self.agency_name,
+            "buyer_seat_id": self.buyer_seat_id,
+            "target_dsp": self.target_dsp,
+            "status": "active",
+            "created_at": self.created_at,
+            "gam_network_code": self.gam_network_code,
+            "simulated": True,  # PMP deals are simulated for demo
+            "openrtb_params": {
+                "id": self.deal_id,
+                "bidfloor": self.floor_price,
+                "bidfloorcur": "USD",
+                "at": 1,  # First price auction
+                "wseat": [self.buyer_seat_id],
+                "wadomain": [],
+            },
+            "dsp_activation": {
+                "platform": dsp_config["platform"],
+                "deal_id": self.deal_id,
+                "activation_url": dsp_config["activation_url"],
+                "instructions": dsp_config["instructions"].format(
+                    deal_id=self.deal_id, floor_price=self.floor_price
+                ).split("\n"),
+            }
+        }
+
+
 class PublisherInventory:
     """Publisher's CTV inventory available for programmatic buying."""
 
+    __slots__ = (
+        "publisher_name",
+        "gam_network_code",
+        "products",
+        "products_by_id",
+        "products_by_publisher",
+        "products_json",
+        "products_json_by_publisher",
+        "tool_cache",
+        "gam_orders",
+        "pmp_deals",
+        "pmp_deal_json",
+        "pmp_deal_etags",
+        "request_log",
+        "gam_connected",
+        "gam_soap_client",
+        "gam_rest_client",
+        "gam_advertiser_ids",
+        "default_trafficker_id",
+        "private_auction_id",
+    )
+
     def __init__(self):
         self.publisher_name = "Premium Streaming Network"
 
@@ -102,97 +266,147 @@ class PublisherInventory:
 
         # Products reference real GAM ad unit IDs (created during startup)
         self.products = [
-            {
-                "id": "ctv-hbo-max-001",
-                "name": "HBO Max - Premium Streaming",
-                "channel": "ctv",
-                "publisher": "HBO Max",
-                "inventory_type": "streaming_vod",
-                "base_cpm": 32.00,
-                "floor_cpm": 26.00,
-                "available_impressions": 25_000_000,
-                "targeting_options": ["household", "demographic", "behavioral", "contextual"],
-                "ad_formats": ["15s", "30s", "60s"],
-                "supported_deal_types": ["programmatic_guaranteed", "private_marketplace"],
-                "gam_ad_unit_id": None,  # Set during GAM initialization
-                "gam_ad_unit_name": "HBO Max CTV",
-            },
-            {
-                "id": "ctv-peacock-001",
-                "name": "Peacock - Premium Streaming",
-                "channel": "ctv",
-                "publisher": "Peacock",
-                "inventory_type": "streaming_vod",
-                "base_cpm": 28.00,
-                "floor_cpm": 22.00,
-                "available_impressions": 35_000_000,
-                "targeting_options": ["household", "demographic", "behavioral"],
-                "ad_formats": ["15s", "30s"],
-                "supported_deal_types": ["programmatic_guaranteed", "private_marketplace"],
-                "gam_ad_unit_id": None,
-                "gam_ad_unit_name": "Peacock CTV",
-            },
-            {
-                "id": "ctv-paramount-001",
-                "name": "Paramount+ - Premium Streaming",
-                "channel": "ctv",
-                "publisher": "Paramount+",
-                "inventory_type": "streaming_vod",
-                "base_cpm": 26.00,
-                "floor_cpm": 20.00,
-                "available_impressions": 40_000_000,
-                "targeting_options": ["household", "demographic"],
-                "ad_formats": ["15s", "30s"],
-                "supported_deal_types": ["programmatic_guaranteed", "private_marketplace"],
-                "gam_ad_unit_id": None,
-                "gam_ad_unit_name": "Paramount Plus CTV",
-            },
-            {
-                "id": "ctv-hulu-001",
-                "name": "Hulu - Premium Streaming",
-                "channel": "ctv",
-                "publisher": "Hulu",
-                "inventory_type": "streaming_vod",
-                "base_cpm": 24.00,
-                "floor_cpm": 18.00,
-                "available_impressions": 50_000_000,
-                "targeting_options": ["household", "demographic", "behavioral"],
-                "ad_formats": ["15s", "30s", "60s"],
-                "supported_deal_types": ["programmatic_guaranteed", "private_marketplace"],
-                "gam_ad_unit_id": None,
-                "gam_ad_unit_name": "Hulu CTV",
-            },
+            Product(
+                id="ctv-hbo-max-001",
+                name="HBO Max - Premium Streaming",
+                channel="ctv",
+                publisher="HBO Max",
+                inventory_type="streaming_vod",
+                base_cpm=32.00,
+                floor_cpm=26.00,
+                available_impressions=25_000_000,
+                targeting_options=["household", "demographic", "behavioral", "contextual"],
+                ad_formats=["15s", "30s", "60s"],
+                supported_deal_types=["programmatic_guaranteed", "private_marketplace"],
+                gam_ad_unit_id=None,  # Set during GAM initialization
+                gam_ad_unit_name="HBO Max CTV",
+            ),
+            Product(
+                id="ctv-peacock-001",
+                name="Peacock - Premium Streaming",
+                channel="ctv",
+                publisher="Peacock",
+                inventory_type="streaming_vod",
+                base_cpm=28.00,
+                floor_cpm=22.00,
+                available_impressions=35_000_000,
+                targeting_options=["household", "demographic", "behavioral"],
+                ad_formats=["15s", "30s"],
+                supported_deal_types=["programmatic_guaranteed", "private_marketplace"],
+                gam_ad_unit_id=None,
+                gam_ad_unit_name="Peacock CTV",
+            ),
+            Product(
+                id="ctv-paramount-001",
+                name="Paramount+ - Premium Streaming",
+                channel="ctv",
+                publisher="Paramount+",
+                inventory_type="streaming_vod",
+                base_cpm=26.00,
+                floor_cpm=20.00,
+                available_impressions=40_000_000,
+                targeting_options=["household", "demographic"],
+                ad_formats=["15s", "30s"],
+                supported_deal_types=["programmatic_guaranteed", "private_marketplace"],
+                gam_ad_unit_id=None,
+                gam_ad_unit_name="Paramount Plus CTV",
+            ),
+            Product(
+                id="ctv-hulu-001",
+                name="Hulu - Premium Streaming",
+                channel="ctv",
+                publisher="Hulu",
+                inventory_type="streaming_vod",
+                base_cpm=24.00,
+                floor_cpm=18.00,
+                available_impressions=50_000_000,
+                targeting_options=["household", "demographic", "behavioral"],
+                ad_formats=["15s", "30s", "60s"],
+                supported_deal_types=["programmatic_guaranteed", "private_marketplace"],
+                gam_ad_unit_id=None,
+                gam_ad_unit_name="Hulu CTV",
+            ),
         ]
 
+        # Lookup indexes (entries are the same objects, so GAM ad unit mapping shows through)
+        self.products_by_id = {p.id: p for p in self.products}
+        self.products_by_publisher = defaultdict(list)
+        for p in self.products:
+            self.products_by_publisher[p.publisher.lower()].append(p)
+
+        # Encoded list_products / get_pricing results; buyer agents repeat
+        # identical lookups within seconds
+        self.tool_cache = TTLCache(ttl=30.0, maxsize=1024)
+        self.refresh_product_cache()
+
         # Track booked orders and deals
-        self.gam_orders = {}  # PG bookings in GAM
-        self.pmp_deals = {}   # PMP deals with Deal IDs
-        self.request_log = []
+        self.gam_orders: dict[str, GAMBooking] = {}  # PG bookings in GAM
+        self.pmp_deals: dict[str, PMPDeal] = {}      # PMP deals with Deal IDs
+        self.pmp_deal_json: dict[str, bytes] = {}    # Encoded once for GET /deals/{deal_id}
+        self.pmp_deal_etags: dict[str, str] = {}     # ETags for those bodies; deals never change
+        self.request_log = deque(maxlen=10_000)  # (timestamp, source, message, args); bounded
 
         # GAM integration state
         self.gam_connected = False
         self.gam_soap_client = None
         self.gam_rest_client = None
+        self.gam_advertiser_ids: dict[str, str] = {}  # Advertiser name -> GAM company ID
         self.default_trafficker_id = None
         self.private_auction_id = None  # For PMP deals
 
+    def refresh_product_cache(self) -> None:
+        """Re-encode the list_products results; call after products change."""
+        self.tool_cache.clear()
+        self.products_json = self.encode_products(self.products)
+        self.products_json_by_publisher = {
+            publisher: self.encode_products(products)
+            for publisher, products in self.products_by_publisher.items()
+        }
+
+    def encode_products(self, products: list[Product]) -> bytes:
+        """Encode a list_products result body."""
+        return orjson.dumps({
+            "publisher": self.publisher_name,
+            "products": products,
+            "total": len(products),
+        })
+
 
 class TieredPricingEngine:
     """Calculate tiered pricing based on buyer identity and deal type."""
 
-    TIER_DISCOUNTS = {
+    TIER_DISCOUNTS = MappingProxyType({
         "public": 0,
         "seat": 5,
         "agency": 10,
         "advertiser": 15,
-    }
+    })
 
-    VOLUME_DISCOUNTS = [
+    VOLUME_DISCOUNTS = (
         (50_000_000, 8),
         (25_000_000, 5),
         (10_000_000, 3),
         (5_000_000, 2),
-    ]
+    )
+
+    # Ascending thresholds for bisect; _VOLUME_RATES[i] applies when volume
+    # clears exactly i thresholds
+    _VOLUME_THRESHOLDS = tuple(sorted(threshold for threshold, _ in VOLUME_DISCOUNTS))
+    _VOLUME_RATES = (0,) + tuple(discount for _, discount in sorted(VOLUME_DISCOUNTS))
+
+    @classmethod
+    def volume_discount(cls, volume: int) -> int:
+        """Percentage off for the highest VOLUME_DISCOUNTS threshold the volume reaches."""
+        return cls._VOLUME_RATES[bisect.bisect_right(cls._VOLUME_THRESHOLDS, volume)]
+
+    @staticmethod
+    def validate_floor(
+        product_floor: float,
+        offered: float,
+        message: str = "Price ${offered} below floor ${floor}",
+    ) -> Optional[str]:
+        """Error message if the offered CPM is under the product floor, else None."""
+        return None if offered >= product_floor else message.format(offered=offered, floor=product_floor)
 
     @classmethod
     def calculate_price(
@@ -204,13 +418,38 @@ class TieredPricingEngine:
         deal_type: str
     ) -> dict:
         """Calculate final price with all discounts."""
-        tier_discount = cls.TIER_DISCOUNTS.get(buyer_tier.lower(), 0)
+        # Pass the discount rather than the volume: warm() precomputed every
+        # discount bucket, so any volume lands on a cached breakdown
+        return dict(cls._price_breakdown(
+            base_price, floor_price, buyer_tier, cls.volume_discount(volume), deal_type
+        ))
 
-        volume_discount = 0
-        for threshold, discount in cls.VOLUME_DISCOUNTS:
-            if volume >= threshold:
-                volume_discount = discount
-                break
+    @classmethod
+    def warm(cls, products: list[Product]) -> None:
+        """Precompute every (product, tier, volume bucket, deal type) price at startup."""
+        for product in products:
+            for buyer_tier in cls.TIER_DISCOUNTS:
+                for volume_discount in cls._VOLUME_RATES:
+                    for deal_type in product.supported_deal_types:
+                        cls._price_breakdown(
+                            product.base_cpm, product.floor_cpm, buyer_tier, volume_discount, deal_type
+                        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _price_breakdown(
+        cls,
+        base_price: float,
+        floor_price: float,
+        buyer_tier: str,
+        volume_discount: int,
+        deal_type: str
+    ) -> tuple:
+        """Price breakdown as (key, value) pairs; a tuple so lru_cache can share it safely."""
+        # The tool schema enumerates lowercase tiers, so only fold case on a miss
+        tier_discount = cls.TIER_DISCOUNTS.get(buyer_tier)
+        if tier_discount is None:
+            tier_discount = cls.TIER_DISCOUNTS.get(buyer_tier.lower(), 0)
 
         # Deal type pricing
         if deal_type == "programmatic_guaranteed":
@@ -226,27 +465,45 @@ class TieredPricingEngine:
         # Ensure we don't go below floor
         final_price = max(final_price, floor_price)
 
-        return {
-            "base_price": base_price,
-            "floor_price": floor_price,
-            "tier": buyer_tier,
-            "tier_discount": tier_discount,
-            "volume_discount": volume_discount,
-            "deal_type": deal_type,
-            "total_discount": max(0, total_discount),
-            "final_price": round(final_price, 2),
-        }
+        return (
+            ("base_price", base_price),
+            ("floor_price", floor_price),
+            ("tier", buyer_tier),
+            ("tier_discount", tier_discount),
+            ("volume_discount", volume_discount),
+            ("deal_type", deal_type),
+            ("total_discount", max(0, total_discount)),
+            ("final_price", round(final_price, 2)),
+        )
 
 
 # Global state
 inventory = PublisherInventory()
 pricing_engine = TieredPricingEngine()
+pricing_engine.warm(inventory.products)
+
+
+# Suffix for GAM order names
+_order_seq = itertools.count(1)
+
 
 # =============================================================================
 # GAM Integration (REAL - Live GAM Connection)
 # =============================================================================
 
-def initialize_gam_connection():
+def match_ad_unit(product_name_key: str, ad_unit_map: dict) -> Optional[Any]:
+    """First ad unit, in listing order, whose name contains or is contained in the product's.
+
+    ad_unit_map is keyed by lowercased ad unit name. Matching is plain
+    substring containment, so partial words count ("ctv" matches "ctvpremium").
+    """
+    for au_name, au in ad_unit_map.items():
+        if product_name_key in au_name or au_name in product_name_key:
+            return au
+    return None
+
+
+async def initialize_gam_connection():
     """Initialize connection to Google Ad Manager and set up demo inventory."""
     global inventory
 
@@ -271,65 +528,90 @@ def initialize_gam_connection():
             network_code=settings.gam_network_code,
             credentials_path=settings.gam_json_key_path,
         )
-        soap_client.connect()
+        await asyncio.to_thread(soap_client.connect)
         inventory.gam_soap_client = soap_client
-        log_event("GAM", f"✓ Connected to GAM network {settings.gam_network_code}")
+        log_event("GAM", "✓ Connected to GAM network %s", settings.gam_network_code)
+
+        # The trafficker lookup and ad unit listing are independent SOAP
+        # round-trips, so overlap them
+        log_event("GAM", "Fetching current user and existing ad units...")
+        current_user, ad_units = await asyncio.gather(
+            asyncio.to_thread(soap_client.get_current_user),
+            asyncio.to_thread(soap_client.list_ad_units, limit=100),
+            return_exceptions=True,
+        )
 
         # Get current user as default trafficker
-        try:
-            current_user = soap_client.get_current_user()
+        if isinstance(current_user, Exception):
+            log_event("GAM", "Warning: Could not get current user: %s", current_user)
+            inventory.default_trafficker_id = "0"
+        else:
             # ZEEP returns objects, use getattr
             inventory.default_trafficker_id = str(getattr(current_user, "id", 0))
             user_name = getattr(current_user, "name", "Unknown")
-            log_event("GAM", f"✓ Default trafficker: {user_name} (ID: {inventory.default_trafficker_id})")
-        except Exception as e:
-            log_event("GAM", f"Warning: Could not get current user: {e}")
-            inventory.default_trafficker_id = "0"
+            log_event("GAM", "✓ Default trafficker: %s (ID: %s)", user_name, inventory.default_trafficker_id)
 
-        # List existing ad units and map to products
-        log_event("GAM", "Fetching existing ad units...")
-        ad_units = soap_client.list_ad_units(limit=100)
+        # Map existing ad units to products
+        if isinstance(ad_units, Exception):
+            raise ad_units
         ad_unit_map = {au.name.lower(): au for au in ad_units}
-        log_event("GAM", f"✓ Found {len(ad_units)} ad units in GAM")
+        log_event("GAM", "✓ Found %d ad units in GAM", len(ad_units))
 
         # Map products to existing ad units or use first available
         for product in inventory.products:
-            product_name_key = product["gam_ad_unit_name"].lower()
-
-            # Try to find matching ad unit
-            matched = False
-            for au_name, au in ad_unit_map.items():
-                if product_name_key in au_name or au_name in product_name_key:
-                    product["gam_ad_unit_id"] = au.id
-                    log_event("GAM", f"  Mapped {product['id']} → Ad Unit {au.id} ({au.name})")
-                    matched = True
-                    break
-
-            if not matched and ad_units:
+            au = match_ad_unit(product.gam_ad_unit_name.lower(), ad_unit_map)
+            if au is not None:
+                product.gam_ad_unit_id = au.id
+                log_event("GAM", "  Mapped %s → Ad Unit %s (%s)", product.id, au.id, au.name)
+            elif ad_units:
                 # Use first available ad unit for demo
-                product["gam_ad_unit_id"] = ad_units[0].id
-                log_event("GAM", f"  Mapped {product['id']} → Ad Unit {ad_units[0].id} (default)")
+                product.gam_ad_unit_id = ad_units[0].id
+                log_event("GAM", "  Mapped %s → Ad Unit %s (default)", product.id, ad_units[0].id)
 
+        inventory.refresh_product_cache()
         inventory.gam_connected = True
         log_event("GAM", "✓ GAM integration ready!")
         return True
 
     except Exception as e:
-        log_event("GAM", f"✗ Failed to connect to GAM: {e}")
+        log_event("GAM", "✗ Failed to connect to GAM: %s", e)
         return False
 
 
 def get_or_create_advertiser(advertiser_name: str) -> str:
     """Get or create an advertiser in GAM."""
     if not inventory.gam_connected or not inventory.gam_soap_client:
-        return f"SIM-ADV-{uuid.uuid4().hex[:8].upper()}"
+        return f"SIM-ADV-{new_id()}"
+
+    # Advertiser IDs never change once created, so only the first booking for
+    # an advertiser pays the lookup round-trip
+    advertiser_id = inventory.gam_advertiser_ids.get(advertiser_name)
+    if advertiser_id:
+        return advertiser_id
 
     try:
         advertiser_id = inventory.gam_soap_client.get_or_create_advertiser(advertiser_name)
+        inventory.gam_advertiser_ids[advertiser_name] = advertiser_id
         return advertiser_id
     except Exception as e:
-        log_event("GAM", f"Warning: Could not get/create advertiser: {e}")
-        return f"SIM-ADV-{uuid.uuid4().hex[:8].upper()}"
+        log_event("GAM", "Warning: Could not get/create advertiser: %s", e)
+        return f"SIM-ADV-{new_id()}"
+
+
+def gam_order_notes(advertiser_name: str, agency_name: str = None) -> str:
+    """Notes attached to every OpenDirect order."""
+    return f"Created via OpenDirect - Advertiser: {advertiser_name}, Agency: {agency_name or 'Direct'}"
+
+
+def gam_order_result(order) -> dict:
+    """Summarize a created GAM order for the MCP response."""
+    return {
+        "order_id": order.id,
+        "order_name": order.name,
+        "advertiser_id": order.advertiser_id,
+        "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
+        "simulated": False,
+    }
 
 
 def create_gam_order(
@@ -340,7 +622,7 @@ def create_gam_order(
     """Create an order in GAM."""
     if not inventory.gam_connected or not inventory.gam_soap_client:
         # Simulation fallback
-        order_id = f"SIM-ORD-{uuid.uuid4().hex[:8].upper()}"
+        order_id = f"SIM-ORD-{new_id()}"
         return {
             "order_id": order_id,
             "order_name": order_name,
@@ -357,22 +639,16 @@ def create_gam_order(
             name=order_name,
             advertiser_id=advertiser_id,
             trafficker_id=inventory.default_trafficker_id,
-            notes=f"Created via OpenDirect - Advertiser: {advertiser_name}, Agency: {agency_name or 'Direct'}",
+            notes=gam_order_notes(advertiser_name, agency_name),
         )
 
-        log_event("GAM", f"✓ Created Order: {order.id} - {order.name}")
+        log_event("GAM", "✓ Created Order: %s - %s", order.id, order.name)
 
-        return {
-            "order_id": order.id,
-            "order_name": order.name,
-            "advertiser_id": order.advertiser_id,
-            "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
-            "simulated": False,
-        }
+        return gam_order_result(order)
 
     except Exception as e:
-        log_event("GAM", f"✗ Error creating order: {e}")
-        order_id = f"ERR-ORD-{uuid.uuid4().hex[:8].upper()}"
+        log_event("GAM", "✗ Error creating order: %s", e)
+        order_id = f"ERR-ORD-{new_id()}"
         return {
             "order_id": order_id,
             "order_name": order_name,
@@ -382,6 +658,63 @@ def create_gam_order(
         }
 
 
+def gam_line_item_spec(
+    order_id: str,
+    line_name: str,
+    ad_unit_id: str,
+    impressions: int,
+    cpm_price: float,
+    start_date: str,
+    end_date: str,
+    targeting: dict = None,
+) -> dict:
+    """Build the GAMSoapClient.create_line_item arguments for a PG line."""
+    # Build targeting
+    gam_targeting = GAMTargeting(
+        inventory_targeting=GAMInventoryTargeting(
+            targeted_ad_units=[
+                GAMAdUnitTargeting(ad_unit_id=ad_unit_id, include_descendants=True)
+            ]
+        )
+    )
+
+    # Build goal
+    goal = GAMGoal(
+        goal_type=GAMGoalType.LIFETIME,
+        unit_type=GAMUnitType.IMPRESSIONS,
+        units=impressions,
+    )
+
+    return {
+        "order_id": order_id,
+        "name": line_name,
+        "line_item_type": GAMLineItemType.STANDARD,
+        "targeting": gam_targeting,
+        "cost_per_unit": GAMMoney.from_dollars(cpm_price),
+        "goal": goal,
+        "start_time": datetime.fromisoformat(start_date),
+        "end_time": datetime.fromisoformat(end_date),
+        "cost_type": GAMCostType.CPM,
+        "creative_sizes": [(300, 250), (728, 90), (1920, 1080)],  # Include CTV size
+        "external_id": f"OD-{new_id()}",
+        "notes": f"OpenDirect PG Line - {impressions:,} impressions @ ${cpm_price} CPM",
+    }
+
+
+def gam_line_item_result(line_item, order_id: str, impressions: int, cpm_price: float) -> dict:
+    """Summarize a created GAM line item for the MCP response."""
+    return {
+        "line_id": line_item.id,
+        "order_id": order_id,
+        "line_name": line_item.name,
+        "impressions": impressions,
+        "cpm_price": cpm_price,
+        "total_budget": round(cpm_price * impressions / 1000, 2),
+        "status": line_item.status.value if hasattr(line_item.status, 'value') else str(line_item.status),
+        "simulated": False,
+    }
+
+
 def create_gam_line_item(
     order_id: str,
     line_name: str,
@@ -395,7 +728,7 @@ def create_gam_line_item(
     """Create a line item in GAM."""
     if not inventory.gam_connected or not inventory.gam_soap_client:
         # Simulation fallback
-        line_id = f"SIM-LINE-{uuid.uuid4().hex[:8].upper()}"
+        line_id = f"SIM-LINE-{new_id()}"
         return {
             "line_id": line_id,
             "order_id": order_id,
@@ -408,61 +741,18 @@ def create_gam_line_item(
         }
 
     try:
-        # Parse dates
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-        # Build targeting
-        gam_targeting = GAMTargeting(
-            inventory_targeting=GAMInventoryTargeting(
-                targeted_ad_units=[
-                    GAMAdUnitTargeting(ad_unit_id=ad_unit_id, include_descendants=True)
-                ]
-            )
-        )
-
-        # Build goal
-        goal = GAMGoal(
-            goal_type=GAMGoalType.LIFETIME,
-            unit_type=GAMUnitType.IMPRESSIONS,
-            units=impressions,
-        )
-
-        # Build cost
-        cost_per_unit = GAMMoney.from_dollars(cpm_price)
-
         # Create line item (STANDARD for PG with fixed impressions)
         line_item = inventory.gam_soap_client.create_line_item(
-            order_id=order_id,
-            name=line_name,
-            line_item_type=GAMLineItemType.STANDARD,
-            targeting=gam_targeting,
-            cost_per_unit=cost_per_unit,
-            goal=goal,
-            start_time=start_dt,
-            end_time=end_dt,
-            cost_type=GAMCostType.CPM,
-            creative_sizes=[(300, 250), (728, 90), (1920, 1080)],  # Include CTV size
-            external_id=f"OD-{uuid.uuid4().hex[:8].upper()}",
-            notes=f"OpenDirect PG Line - {impressions:,} impressions @ ${cpm_price} CPM",
+            **gam_line_item_spec(order_id, line_name, ad_unit_id, impressions, cpm_price, start_date, end_date)
         )
 
-        log_event("GAM", f"✓ Created Line Item: {line_item.id} - {line_item.name}")
+        log_event("GAM", "✓ Created Line Item: %s - %s", line_item.id, line_item.name)
 
-        return {
-            "line_id": line_item.id,
-            "order_id": order_id,
-            "line_name": line_item.name,
-            "impressions": impressions,
-            "cpm_price": cpm_price,
-            "total_budget": round(cpm_price * impressions / 1000, 2),
-            "status": line_item.status.value if hasattr(line_item.status, 'value') else str(line_item.status),
-            "simulated": False,
-        }
+        return gam_line_item_result(line_item, order_id, impressions, cpm_price)
 
     except Exception as e:
-        log_event("GAM", f"✗ Error creating line item: {e}")
-        line_id = f"ERR-LINE-{uuid.uuid4().hex[:8].upper()}"
+        log_event("GAM", "✗ Error creating line item: %s", e)
+        line_id = f"ERR-LINE-{new_id()}"
         return {
             "line_id": line_id,
             "order_id": order_id,
@@ -483,16 +773,179 @@ def approve_gam_order(order_id: str) -> dict:
 
     try:
         order = inventory.gam_soap_client.approve_order(order_id)
-        log_event("GAM", f"✓ Approved Order: {order.id}")
-        return {
-            "order_id": order.id,
-            "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
-            "simulated": False,
-        }
+        log_event("GAM", "✓ Approved Order: %s", order.id)
+        return gam_approval_result(order)
     except Exception as e:
-        log_event("GAM", f"Warning: Could not approve order: {e}")
+        log_event("GAM", "Warning: Could not approve order: %s", e)
         return {"order_id": order_id, "status": "APPROVAL_PENDING", "error": str(e)}
 
+
+def gam_approval_result(order) -> dict:
+    """Summarize an approved GAM order for the MCP response."""
+    return {
+        "order_id": order.id,
+        "status": order.status.value if hasattr(order.status, 'value') else str(order.status),
+        "simulated": False,
+    }
+
+
+def book_gam_order(booking: dict) -> tuple[dict, Optional[dict], Optional[dict]]:
+    """Create, fill and approve a single PG order, one GAM round-trip per step."""
+    order = create_gam_order(booking["order_name"], booking["advertiser_name"], booking["agency_name"])
+    if order.get("error"):
+        return order, None, None
+
+    line_item = create_gam_line_item(order_id=order["order_id"], **booking["line"])
+    approval = approve_gam_order(order["order_id"])
+    return order, line_item, approval
+
+
+def book_gam_orders(bookings: list[dict]) -> list[tuple[dict, Optional[dict], Optional[dict]]]:
+    """Book several PG orders with one createOrders, createLineItems and ApproveOrders call.
+
+    If a bulk call fails, that step is retried per booking so only the bad
+    booking reports an error instead of the whole batch.
+    """
+    if len(bookings) == 1:
+        return [book_gam_order(bookings[0])]
+
+    client = inventory.gam_soap_client
+    try:
+        advertiser_ids = {
+            name: get_or_create_advertiser(name)
+            for name in {booking["advertiser_name"] for booking in bookings}
+        }
+        orders = client.create_orders([
+            {
+                "name": booking["order_name"],
+                "advertiser_id": advertiser_ids[booking["advertiser_name"]],
+                "trafficker_id": inventory.default_trafficker_id,
+                "notes": gam_order_notes(booking["advertiser_name"], booking["agency_name"]),
+            }
+            for booking in bookings
+        ])
+    except Exception as e:
+        log_event("GAM", "Warning: Batched order creation failed, booking individually: %s", e)
+        return [book_gam_order(booking) for booking in bookings]
+
+    for order in orders:
+        log_event("GAM", "✓ Created Order: %s - %s", order.id, order.name)
+
+    try:
+        line_items = client.create_line_items([
+            gam_line_item_spec(order.id, **booking["line"])
+            for order, booking in zip(orders, bookings)
+        ])
+        line_results = []
+        for line_item, order, booking in zip(line_items, orders, bookings):
+            log_event("GAM", "✓ Created Line Item: %s - %s", line_item.id, line_item.name)
+            line = booking["line"]
+            line_results.append(gam_line_item_result(line_item, order.id, line["impressions"], line["cpm_price"]))
+    except Exception as e:
+        log_event("GAM", "Warning: Batched line item creation failed, creating individually: %s", e)
+        line_results = [
+            create_gam_line_item(order_id=order.id, **booking["line"])
+            for order, booking in zip(orders, bookings)
+        ]
+
+    try:
+        approved = {order.id: order for order in client.approve_orders([order.id for order in orders])}
+        approvals = []
+        for order in orders:
+            if order.id in approved:
+                log_event("GAM", "✓ Approved Order: %s", order.id)
+                approvals.append(gam_approval_result(approved[order.id]))
+            else:
+                approvals.append({"order_id": order.id, "status": "APPROVAL_PENDING"})
+    except Exception as e:
+        log_event("GAM", "Warning: Batched approval failed, approving individually: %s", e)
+        approvals = [approve_gam_order(order.id) for order in orders]
+
+    return list(zip((gam_order_result(order) for order in orders), line_results, approvals))
+
+
+class GAMBatcher:
+    """Coalesce concurrent PG bookings into bulk GAM SOAP calls.
+
+    Bookings that arrive within ``max_wait`` seconds of each other (up to
+    ``max_batch``) share one createOrders, one createLineItems and one
+    ApproveOrders round-trip. The SOAP client is synchronous, so each batch
+    runs in a worker thread to keep the event loop free.
+
+    The drain task is started and stopped by the app lifespan, so it runs on
+    the serving loop; while it is not running, bookings go straight to GAM.
+    """
+
+    def __init__(self, max_batch: int = 50, max_wait: float = 0.02):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the drain task on the running loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        """Book everything already queued, then end the drain task."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        # The sentinel queues behind pending bookings, so none are dropped
+        await self._queue.put(None)
+        await task
+
+    async def submit(self, booking: dict) -> tuple[dict, Optional[dict], Optional[dict]]:
+        """Queue a booking and wait for its (order, line_item, approval) result."""
+        if self._task is None:
+            return (await asyncio.to_thread(book_gam_orders, [booking]))[0]
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((booking, future))
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._book(batch)
+
+    @staticmethod
+    async def _book(batch: list) -> None:
+        """Book one batch and resolve each caller's future."""
+        try:
+            results = await asyncio.to_thread(book_gam_orders, [booking for booking, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+gam_batcher = GAMBatcher()
+
 # =============================================================================
 # MCP Tool Definitions
 # =============================================================================
@@ -588,86 +1041,235 @@ MCP_TOOLS = [
     }
 ]
 
+# The tool catalog and service descriptor never change, so encode them once at import
+TOOLS_JSON = orjson.dumps({"tools": MCP_TOOLS})
+ROOT_JSON = orjson.dumps({
+    "name": "Publisher Seller Agent",
+    "publisher": inventory.publisher_name,
+    "integration": "Google Ad Manager",
+    "port": 8001,
+    "capabilities": ["programmatic_guaranteed", "private_marketplace"],
+})
+TOOLS_ETAG = etag_for(TOOLS_JSON)
+
+
+# Typed tool arguments, validated once in call_tool. Defaults mirror the
+# inputSchema above; handlers read attributes instead of args.get() chains.
+class ListProductsArgs(BaseModel):
+    publisher: Optional[str] = None
+
+
+class GetPricingArgs(BaseModel):
+    product_id: str
+    buyer_tier: str = "public"
+    volume: int = 0
+    deal_type: str = "private_marketplace"
+
+
+class CheckAvailabilityArgs(BaseModel):
+    product_id: str
+    impressions: int = 0
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
+class BookPGArgs(BaseModel):
+    product_id: str
+    impressions: int
+    cpm_price: float
+    advertiser_name: str
+    agency_name: str = "Direct"
+    campaign_name: Optional[str] = None
+    start_date: str = "2026-03-01"
+    end_date: str = "2026-06-30"
+    targeting: dict[str, Any] = {}
+
+
+class CreatePMPDealArgs(BaseModel):
+    product_id: str
+    floor_price: float
+    buyer_seat_id: str
+    impressions: int = 0
+    advertiser_name: str = "Unknown"
+    agency_name: str = "Direct"
+    target_dsp: str = "generic_dsp"
+    start_date: str = "2026-03-01"
+    end_date: str = "2026-06-30"
+
+
+TOOL_MODELS: dict[str, type[BaseModel]] = {
+    "list_products": ListProductsArgs,
+    "get_pricing": GetPricingArgs,
+    "check_availability": CheckAvailabilityArgs,
+    "book_programmatic_guaranteed": BookPGArgs,
+    "create_pmp_deal": CreatePMPDealArgs,
+}
+
+
+# /mcp/call and /mcp/batch bodies, decoded and validated straight from the
+# request bytes by pydantic's JSON parser
+class ToolCall(BaseModel):
+    name: str
+    arguments: dict[str, Any] = {}
+    id: Any = None  # Caller's correlation id, echoed back by /mcp/batch
+
+
+class ToolBatch(BaseModel):
+    requests: list[ToolCall]
+
 # =============================================================================
 # Logging
 # =============================================================================
 
-def log_event(source: str, message: str):
-    """Log an event with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    entry = {"timestamp": timestamp, "source": source, "message": message}
-    inventory.request_log.append(entry)
+# Set PUBLISHER_LOG_VERBOSE=false to keep the activity log in memory only
+LOG_VERBOSE = os.getenv("PUBLISHER_LOG_VERBOSE", "true").lower() != "false"
 
-    if RICH_AVAILABLE:
-        color = "cyan" if source == "MCP" else "magenta" if source == "GAM" else "green"
-        console.print(f"[dim]{timestamp}[/dim] [{color}]{source}[/{color}] → {message}")
-    else:
-        print(f"{timestamp} [{source}] {message}")
+activity_log = ActivityLog("publisher_gam_server.activity", {
+    "MCP": "[cyan]MCP[/cyan]",
+    "GAM": "[magenta]GAM[/magenta]",
+})
+
+
+def log_event(source: str, message: str, *args):
+    """Log an event with timestamp.
+
+    Like logging, ``message`` is a %-format string merged with ``args`` only
+    when the entry is rendered, so call sites should pass values as args.
+    """
+    timestamp = clock_now()
+    inventory.request_log.append((timestamp, source, message, args))
+
+    if LOG_VERBOSE:
+        activity_log.log(timestamp, source, message, *args)
 
 
 # =============================================================================
 # MCP Tool Handlers
 # =============================================================================
 
-def handle_list_products(args: dict) -> dict:
-    """Handle list_products tool call."""
-    publisher_filter = args.get("publisher")
+# Per deal type: short label for errors, the key that reports the floor, and
+# the below-floor message (clients match on these, so each keeps its wording)
+DEAL_TYPE_RULES = {
+    "programmatic_guaranteed": ("PG", "floor_price", "Price ${offered} below floor ${floor}"),
+    "private_marketplace": ("PMP", "minimum_floor", "Floor ${offered} below minimum ${floor}"),
+}
 
-    products = inventory.products
-    if publisher_filter:
-        products = [p for p in products if publisher_filter.lower() in p["publisher"].lower()]
 
-    log_event("MCP", f"list_products → {len(products)} products")
+def resolve_product(
+    product_id: str,
+    deal_type: Optional[str] = None,
+    price: Optional[float] = None,
+) -> tuple[Optional[Product], Optional[dict]]:
+    """Look up a product and, given a deal_type, check it can be booked that way at price.
 
-    return {
-        "publisher": inventory.publisher_name,
-        "products": products,
-        "total": len(products),
-    }
+    Returns (product, None) when found (and bookable), otherwise (None, error_response).
+    """
+    product = inventory.products_by_id.get(product_id)
+    if not product:
+        return None, {"error": f"Product {product_id} not found"}
+    if deal_type is None:
+        return product, None
 
+    label, floor_key, floor_message = DEAL_TYPE_RULES[deal_type]
+    if deal_type not in product.supported_deal_types:
+        return None, {"error": f"Product {product_id} does not support {label} deals"}
 
-def handle_get_pricing(args: dict) -> dict:
-    """Handle get_pricing tool call."""
-    product_id = args.get("product_id")
-    buyer_tier = args.get("buyer_tier", "public")
-    volume = args.get("volume", 0)
-    deal_type = args.get("deal_type", "private_marketplace")
+    floor_error = pricing_engine.validate_floor(product.floor_cpm, price, floor_message)
+    if floor_error:
+        return None, {"error": floor_error, floor_key: product.floor_cpm}
 
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
-    if not product:
-        return {"error": f"Product {product_id} not found"}
+    return product, None
+
+
+async def handle_list_products(args: ListProductsArgs) -> dict | bytes:
+    """Handle list_products tool call."""
+    publisher_filter = args.publisher
+
+    if not publisher_filter:
+        log_event("MCP", "list_products → %d products", len(inventory.products))
+        return inventory.products_json
+
+    # Exact publisher names are pre-encoded; anything else is a substring match
+    needle = publisher_filter.lower()
+    payload = inventory.products_json_by_publisher.get(needle)
+    if payload is not None:
+        log_event("MCP", "list_products → %d products", len(inventory.products_by_publisher[needle]))
+        return payload
+
+    cache_key = ("list_products", needle)
+    cached = inventory.tool_cache.get(cache_key)
+    if cached is not None:
+        payload, total = cached
+        log_event("MCP", "list_products → %d products", total)
+        return payload
+
+    # The index keys are already lowercased, so match on each publisher once
+    products = [
+        p
+        for publisher, group in inventory.products_by_publisher.items()
+        if needle in publisher
+        for p in group
+    ]
+
+    log_event("MCP", "list_products → %d products", len(products))
+
+    payload = inventory.encode_products(products)
+    inventory.tool_cache.set(cache_key, (payload, len(products)))
+    return payload
+
+
+async def handle_get_pricing(args: GetPricingArgs) -> dict | bytes:
+    """Handle get_pricing tool call."""
+    product_id = args.product_id
+    buyer_tier = args.buyer_tier
+    volume = args.volume
+    deal_type = args.deal_type
+
+    # Pricing only depends on volume through its discount bucket
+    cache_key = ("get_pricing", product_id, buyer_tier, pricing_engine.volume_discount(volume), deal_type)
+    cached = inventory.tool_cache.get(cache_key)
+    if cached is not None:
+        payload, final_price = cached
+        log_event("MCP", "get_pricing → %s: $%s CPM (%s)", product_id, final_price, deal_type)
+        return payload
+
+    product, error = resolve_product(product_id)
+    if error:
+        return error
 
     pricing = pricing_engine.calculate_price(
-        base_price=product["base_cpm"],
-        floor_price=product["floor_cpm"],
+        base_price=product.base_cpm,
+        floor_price=product.floor_cpm,
         buyer_tier=buyer_tier,
         volume=volume,
         deal_type=deal_type
     )
 
-    log_event("MCP", f"get_pricing → {product_id}: ${pricing['final_price']} CPM ({deal_type})")
+    log_event("MCP", "get_pricing → %s: $%s CPM (%s)", product_id, pricing["final_price"], deal_type)
 
-    return {
+    payload = orjson.dumps({
         "product_id": product_id,
-        "product_name": product["name"],
-        "publisher": product["publisher"],
+        "product_name": product.name,
+        "publisher": product.publisher,
         "pricing": pricing,
-    }
+    })
+    inventory.tool_cache.set(cache_key, (payload, pricing["final_price"]))
+    return payload
 
 
-def handle_check_availability(args: dict) -> dict:
+async def handle_check_availability(args: CheckAvailabilityArgs) -> dict:
     """Handle check_availability tool call."""
-    product_id = args.get("product_id")
-    impressions = args.get("impressions", 0)
+    product_id = args.product_id
+    impressions = args.impressions
 
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
-    if not product:
-        return {"error": f"Product {product_id} not found"}
+    product, error = resolve_product(product_id)
+    if error:
+        return error
 
-    available = product["available_impressions"]
+    available = product.available_impressions
     is_available = impressions <= available
 
-    log_event("MCP", f"check_availability → {product_id}: {'✓' if is_available else '✗'}")
+    log_event("MCP", "check_availability → %s: %s", product_id, "✓" if is_available else "✗")
 
     return {
         "product_id": product_id,
@@ -677,49 +1279,55 @@ def handle_check_availability(args: dict) -> dict:
     }
 
 
-def handle_book_programmatic_guaranteed(args: dict) -> dict:
+async def handle_book_programmatic_guaranteed(args: BookPGArgs) -> dict:
     """Book a PG line directly in GAM (REAL GAM Integration)."""
-    product_id = args.get("product_id")
-    impressions = args.get("impressions")
-    cpm_price = args.get("cpm_price")
-    advertiser_name = args.get("advertiser_name")
-    agency_name = args.get("agency_name", "Direct")
-    campaign_name = args.get("campaign_name", f"{advertiser_name} CTV Campaign")
-    start_date = args.get("start_date", "2026-03-01")
-    end_date = args.get("end_date", "2026-06-30")
-    targeting = args.get("targeting", {})
-
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
-    if not product:
-        return {"error": f"Product {product_id} not found"}
-
-    if "programmatic_guaranteed" not in product["supported_deal_types"]:
-        return {"error": f"Product {product_id} does not support PG deals"}
-
-    # Check floor price
-    if cpm_price < product["floor_cpm"]:
-        return {
-            "error": f"Price ${cpm_price} below floor ${product['floor_cpm']}",
-            "floor_price": product["floor_cpm"]
-        }
+    product_id = args.product_id
+    impressions = args.impressions
+    cpm_price = args.cpm_price
+    advertiser_name = args.advertiser_name
+    agency_name = args.agency_name
+    campaign_name = args.campaign_name or f"{advertiser_name} CTV Campaign"
+    start_date = args.start_date
+    end_date = args.end_date
+    targeting = args.targeting
+
+    product, error = resolve_product(product_id, "programmatic_guaranteed", cpm_price)
+    if error:
+        return error
 
     # Get ad unit ID (either from GAM or simulation)
-    ad_unit_id = product.get("gam_ad_unit_id")
+    ad_unit_id = product.gam_ad_unit_id
     if not ad_unit_id:
-        log_event("GAM", f"Warning: No GAM ad unit for {product_id}, using simulation")
+        log_event("GAM", "Warning: No GAM ad unit for %s, using simulation", product_id)
         ad_unit_id = "0"  # Will use simulation mode
 
-    log_event("GAM", f"Booking PG: {campaign_name} - {impressions:,} imps @ ${cpm_price} CPM")
+    log_event("GAM", "Booking PG: %s - %s imps @ $%s CPM", campaign_name, f"{impressions:,}", cpm_price)
 
-    # Add timestamp to make order name unique (GAM requires unique names)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Add timestamp and sequence number to make order name unique (GAM
+    # requires unique names, and bookings can land in the same second)
+    timestamp = f"{stamp_now()}_{next(_order_seq):04d}"
 
-    # Create GAM order (REAL)
-    order = create_gam_order(
-        order_name=f"{campaign_name} - OpenDirect PG - {timestamp}",
-        advertiser_name=advertiser_name,
-        agency_name=agency_name
-    )
+    booking = {
+        "order_name": f"{campaign_name} - OpenDirect PG - {timestamp}",
+        "advertiser_name": advertiser_name,
+        "agency_name": agency_name,
+        "line": {
+            "line_name": f"{product.publisher} - PG Line - {impressions:,} imps",
+            "ad_unit_id": ad_unit_id,
+            "impressions": impressions,
+            "cpm_price": cpm_price,
+            "start_date": start_date,
+            "end_date": end_date,
+            "targeting": targeting,
+        },
+    }
+
+    # Create, fill and approve the GAM order (REAL). Live bookings go through
+    # the batcher so concurrent requests share bulk SOAP round-trips.
+    if inventory.gam_connected and inventory.gam_soap_client:
+        order, line_item, approval = await gam_batcher.submit(booking)
+    else:
+        order, line_item, approval = book_gam_order(booking)
 
     if order.get("error"):
         return {
@@ -727,33 +1335,16 @@ def handle_book_programmatic_guaranteed(args: dict) -> dict:
             "details": order
         }
 
-    # Create line item (REAL)
-    line_item = create_gam_line_item(
-        order_id=order["order_id"],
-        line_name=f"{product['publisher']} - PG Line - {impressions:,} imps",
-        ad_unit_id=ad_unit_id,
-        impressions=impressions,
-        cpm_price=cpm_price,
-        start_date=start_date,
-        end_date=end_date,
-        targeting=targeting
-    )
-
     if line_item.get("error"):
-        log_event("GAM", f"Warning: Line item creation had issues: {line_item.get('error')}")
-
-    # Approve order (REAL)
-    approval = approve_gam_order(order["order_id"])
+        log_event("GAM", "Warning: Line item creation had issues: %s", line_item.get("error"))
 
     # Store in inventory
-    inventory.gam_orders[order["order_id"]] = {
-        "order": order,
-        "line_items": [line_item],
-        "approval": approval
-    }
+    inventory.gam_orders[order["order_id"]] = GAMBooking(
+        order=order, line_items=[line_item], approval=approval
+    )
 
     is_live = not order.get("simulated", True)
-    log_event("GAM", f"{'✓ LIVE' if is_live else '⚡ SIMULATED'} PG Booking Complete: Order {order['order_id']}")
+    log_event("GAM", "%s PG Booking Complete: Order %s", "✓ LIVE" if is_live else "⚡ SIMULATED", order["order_id"])
 
     return {
         "booking_type": "programmatic_guaranteed",
@@ -764,8 +1355,8 @@ def handle_book_programmatic_guaranteed(args: dict) -> dict:
         "approval_status": approval,
         "product": {
             "id": product_id,
-            "name": product["name"],
-            "publisher": product["publisher"]
+            "name": product.name,
+            "publisher": product.publisher
         },
         "terms": {
             "impressions": impressions,
@@ -782,7 +1373,42 @@ def handle_book_programmatic_guaranteed(args: dict) -> dict:
     }
 
 
-def handle_create_pmp_deal(args: dict) -> dict:
+# DSP-specific activation configuration. Instructions are pre-rendered per
+# platform; only the deal ID and floor are filled in per deal.
+DSP_CONFIGS = {
+    "generic_dsp": {
+        "platform": "DSP",
+        "seat_id_format": "dsp-*",
+        "activation_url": "https://dsp.example.com/deals",
+    },
+    "the_trade_desk": {
+        "platform": "The Trade Desk",
+        "seat_id_format": "ttd-*",
+        "activation_url": "https://desk.thetradedesk.com",
+    },
+    "dv360": {
+        "platform": "Display & Video 360",
+        "seat_id_format": "dv360-*",
+        "activation_url": "https://displayvideo.google.com",
+    },
+    "xandr": {
+        "platform": "Xandr",
+        "seat_id_format": "xandr-*",
+        "activation_url": "https://invest.xandr.com",
+    }
+}
+
+for _dsp_config in DSP_CONFIGS.values():
+    _dsp_config["instructions"] = "\n".join((
+        f"1. Log into {_dsp_config['platform']}",
+        "2. Navigate to Deals / Private Inventory",
+        "3. Add new deal with ID: {deal_id}",
+        "4. Set floor price: ${floor_price} CPM",
+        "5. Apply to your campaign targeting",
+    ))
+
+
+async def handle_create_pmp_deal(args: CreatePMPDealArgs) -> dict:
     """Create a PMP deal and return Deal ID for DSP.
 
     This creates a deal structure that:
@@ -790,113 +1416,58 @@ def handle_create_pmp_deal(args: dict) -> dict:
     2. Is tracked locally for reporting
     3. The Deal ID follows OpenRTB conventions
     """
-    product_id = args.get("product_id")
-    floor_price = args.get("floor_price")
-    impressions = args.get("impressions", 0)
-    advertiser_name = args.get("advertiser_name", "Unknown")
-    agency_name = args.get("agency_name", "Direct")
-    buyer_seat_id = args.get("buyer_seat_id")
-    target_dsp = args.get("target_dsp", "generic_dsp")
-    start_date = args.get("start_date", "2026-03-01")
-    end_date = args.get("end_date", "2026-06-30")
-
-    product = next((p for p in inventory.products if p["id"] == product_id), None)
-    if not product:
-        return {"error": f"Product {product_id} not found"}
-
-    if "private_marketplace" not in product["supported_deal_types"]:
-        return {"error": f"Product {product_id} does not support PMP deals"}
-
-    # Check floor price
-    if floor_price < product["floor_cpm"]:
-        return {
-            "error": f"Floor ${floor_price} below minimum ${product['floor_cpm']}",
-            "minimum_floor": product["floor_cpm"]
-        }
+    product_id = args.product_id
+    floor_price = args.floor_price
+    impressions = args.impressions
+    advertiser_name = args.advertiser_name
+    agency_name = args.agency_name
+    buyer_seat_id = args.buyer_seat_id
+    target_dsp = args.target_dsp
+    start_date = args.start_date
+    end_date = args.end_date
+
+    product, error = resolve_product(product_id, "private_marketplace", floor_price)
+    if error:
+        return error
 
     # Generate Deal ID (format: PMP-<network>-<unique>)
     # NOTE: This is a SIMULATED deal ID for demo purposes.
     # Real PMP deals require GAM Programmatic Direct features to be enabled.
-    deal_id = f"PMP-{inventory.gam_network_code}-{uuid.uuid4().hex[:8].upper()}"
+    deal_id = f"PMP-{inventory.gam_network_code}-{new_id()}"
 
-    log_event("GAM", f"Creating PMP Deal (SIMULATED): {deal_id} - Floor ${floor_price} CPM")
+    log_event("GAM", "Creating PMP Deal (SIMULATED): %s - Floor $%s CPM", deal_id, floor_price)
 
-    # DSP-specific configuration
-    dsp_configs = {
-        "generic_dsp": {
-            "platform": "DSP",
-            "seat_id_format": "dsp-*",
-            "activation_url": "https://dsp.example.com/deals",
-        },
-        "the_trade_desk": {
-            "platform": "The Trade Desk",
-            "seat_id_format": "ttd-*",
-            "activation_url": "https://desk.thetradedesk.com",
-        },
-        "dv360": {
-            "platform": "Display & Video 360",
-            "seat_id_format": "dv360-*",
-            "activation_url": "https://displayvideo.google.com",
-        },
-        "xandr": {
-            "platform": "Xandr",
-            "seat_id_format": "xandr-*",
-            "activation_url": "https://invest.xandr.com",
-        }
-    }
+    dsp_config = DSP_CONFIGS.get(target_dsp, DSP_CONFIGS["generic_dsp"])
 
-    dsp_config = dsp_configs.get(target_dsp, dsp_configs["generic_dsp"])
-
-    deal = {
-        "deal_id": deal_id,
-        "deal_type": "private_marketplace",
-        "product_id": product_id,
-        "product_name": product["name"],
-        "publisher": product["publisher"],
-        "gam_ad_unit_id": product.get("gam_ad_unit_id"),
-        "floor_price": floor_price,
-        "auction_type": "first_price",
-        "impressions_estimate": impressions,
-        "start_date": start_date,
-        "end_date": end_date,
-        "advertiser_name": advertiser_name,
-        "agency_name": agency_name,
-        "buyer_seat_id": buyer_seat_id,
-        "target_dsp": target_dsp,
-        "status": "active",
-        "created_at": datetime.now().isoformat(),
-        "gam_network_code": inventory.gam_network_code,
-        "simulated": True,  # PMP deals are simulated for demo
-        "openrtb_params": {
-            "id": deal_id,
-            "bidfloor": floor_price,
-            "bidfloorcur": "USD",
-            "at": 1,  # First price auction
-            "wseat": [buyer_seat_id],
-            "wadomain": [],
-        },
-        "dsp_activation": {
-            "platform": dsp_config["platform"],
-            "deal_id": deal_id,
-            "activation_url": dsp_config["activation_url"],
-            "instructions": [
-                f"1. Log into {dsp_config['platform']}",
-                "2. Navigate to Deals / Private Inventory",
-                f"3. Add new deal with ID: {deal_id}",
-                f"4. Set floor price: ${floor_price} CPM",
-                "5. Apply to your campaign targeting",
-            ]
-        }
-    }
+    deal = PMPDeal(
+        deal_id=deal_id,
+        product_id=product_id,
+        product_name=product.name,
+        publisher=product.publisher,
+        gam_ad_unit_id=product.gam_ad_unit_id,
+        floor_price=floor_price,
+        impressions_estimate=impressions,
+        start_date=start_date,
+        end_date=end_date,
+        advertiser_name=advertiser_name,
+        agency_name=agency_name,
+        buyer_seat_id=buyer_seat_id,
+        target_dsp=target_dsp,
+        created_at=iso_now(),
+        gam_network_code=inventory.gam_network_code,
+    )
 
+    deal_dict = deal.to_dict()
     inventory.pmp_deals[deal_id] = deal
-    log_event("GAM", f"✓ PMP Deal Created (SIMULATED): {deal_id} → {dsp_config['platform']}")
+    inventory.pmp_deal_json[deal_id] = deal_json = orjson.dumps(deal_dict)
+    inventory.pmp_deal_etags[deal_id] = etag_for(deal_json)
+    log_event("GAM", "✓ PMP Deal Created (SIMULATED): %s → %s", deal_id, dsp_config["platform"])
 
     return {
         "booking_type": "private_marketplace",
         "status": "deal_created",
         "simulated": True,  # PMP deals are simulated - GAM Programmatic Direct not enabled
-        "deal": deal,
+        "deal": deal_dict,
         "next_step": f"Send Deal ID '{deal_id}' to {dsp_config['platform']} to activate",
         "message": "PMP Deal ID created (SIMULATED for demo). In production, this would be registered in GAM Programmatic Direct.",
         "note": "This Deal ID is for demo purposes. Real PMP deals require GAM Programmatic Direct features."
@@ -911,52 +1482,121 @@ TOOL_HANDLERS = {
     "create_pmp_deal": handle_create_pmp_deal,
 }
 
+# name -> (handler, argument model), so dispatch is a single lookup
+TOOL_DISPATCH = {name: (handler, TOOL_MODELS[name]) for name, handler in TOOL_HANDLERS.items()}
+
 # =============================================================================
 # FastAPI Application
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up each server process (main() already did logging and GAM for single-process runs)."""
+    worker = __name__ != "__main__"
+    if worker:
+        activity_log.start()
+        await initialize_gam_connection()
+
+    # The batcher's drain task belongs on the serving loop
+    gam_batcher.start()
+    try:
+        yield
+    finally:
+        await gam_batcher.stop()
+        if worker:
+            activity_log.stop()
+
+
 app = FastAPI(
     title="Publisher Seller Agent (GAM)",
     description="CTV Publisher with Google Ad Manager integration",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Booking and deal results run 1-3KB of repetitive JSON; level 1 gets most of
+# the size win for very little CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
+
 
 @app.get("/")
 async def root():
-    return {
-        "name": "Publisher Seller Agent",
-        "publisher": inventory.publisher_name,
-        "integration": "Google Ad Manager",
-        "port": 8001,
-        "capabilities": ["programmatic_guaranteed", "private_marketplace"]
-    }
+    return Response(content=ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": iso_now()}
 
 
 @app.get("/mcp/tools")
-async def list_tools():
-    return {"tools": MCP_TOOLS}
+async def list_tools(request: Request):
+    return cached_response(request, TOOLS_JSON, TOOLS_ETAG)
+
+
+@app.get("/deals/{deal_id}")
+async def get_deal(deal_id: str, request: Request):
+    # DSPs poll deals; serve the bytes encoded when the deal was created, and
+    # a bodiless 304 to pollers that already have them
+    deal_json = inventory.pmp_deal_json.get(deal_id)
+    if deal_json is None:
+        return ORJSONResponse({"error": f"Deal {deal_id} not found"}, status_code=404)
+    return cached_response(request, deal_json, inventory.pmp_deal_etags[deal_id])
+
+
+async def run_tool_call(tool_name: str, arguments: dict) -> bytes:
+    """Run one tool call and return its encoded success/error envelope."""
+    dispatch = TOOL_DISPATCH.get(tool_name)
+    if dispatch is None:
+        return orjson.dumps({"success": False, "error": f"Tool '{tool_name}' not found"})
+
+    handler, model = dispatch
+    try:
+        result = await handler(model.model_validate(arguments))
+    except Exception as e:
+        return orjson.dumps({"success": False, "error": str(e)})
+
+    if isinstance(result, bytes):
+        # Handler served a pre-encoded JSON result; splice it into the envelope
+        return b"".join((
+            b'{"success":true,"tool":', orjson.dumps(tool_name), b',"result":', result, b"}"
+        ))
+
+    return orjson.dumps({"success": True, "tool": tool_name, "result": result})
 
 
 @app.post("/mcp/call")
 async def call_tool(request: Request):
     try:
-        body = await request.json()
-        tool_name = body.get("name")
-        arguments = body.get("arguments", {})
+        call = ToolCall.model_validate_json(await request.body())
+        content = await run_tool_call(call.name, call.arguments)
+        return Response(content=content, media_type="application/json")
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+MAX_BATCH_CALLS = 100
+
 
-        if tool_name not in TOOL_HANDLERS:
-            return {"success": False, "error": f"Tool '{tool_name}' not found"}
+async def run_batch_call(call: ToolCall) -> bytes:
+    """Run one /mcp/batch entry, tagging its envelope with the caller's id."""
+    envelope = await run_tool_call(call.name, call.arguments)
+    return b"".join((b'{"id":', orjson.dumps(call.id), b",", envelope[1:]))
 
-        handler = TOOL_HANDLERS[tool_name]
-        result = handler(arguments)
 
-        return {"success": True, "tool": tool_name, "result": result}
+@app.post("/mcp/batch")
+async def call_tools(request: Request):
+    """Run several tool calls in one round-trip; results keep request order."""
+    try:
+        calls = ToolBatch.model_validate_json(await request.body()).requests
+        if len(calls) > MAX_BATCH_CALLS:
+            return {"success": False, "error": f"Batch exceeds {MAX_BATCH_CALLS} calls"}
+
+        # Calls run concurrently, so PG bookings in one batch share GAM round-trips
+        results = await asyncio.gather(*(run_batch_call(call) for call in calls))
+        content = b"".join((b'{"success":true,"results":[', b",".join(results), b"]}"))
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         return {"success": False, "error": str(e)}
 
@@ -965,13 +1605,7 @@ async def call_tool(request: Request):
 # Main
 # =============================================================================
 
-def print_banner(gam_connected: bool = False):
-    """Print server banner."""
-    gam_status = "🟢 LIVE" if gam_connected else "🟡 SIMULATION"
-    gam_network = inventory.gam_network_code if gam_connected else "N/A"
-
-    if RICH_AVAILABLE:
-        banner = f"""
+BANNER = """\
 ╔══════════════════════════════════════════════════════════════╗
 ║       PUBLISHER SELLER AGENT - Google Ad Manager Integration ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -994,33 +1628,77 @@ def print_banner(gam_connected: bool = False):
 ║  Waiting for buyer agent connections...                      ║
 ╚══════════════════════════════════════════════════════════════╝
 """
-        console.print(Panel(banner.strip(), style="bold blue"))
+
+PLAIN_BANNER = "\n".join([
+    "",
+    "=" * 60,
+    "PUBLISHER SELLER AGENT - GAM Integration",
+    "=" * 60,
+    "Port: 8001",
+    "GAM Status: {gam_status}",
+    "GAM Network: {gam_network}",
+    "=" * 60,
+    "",
+])
+
+
+def print_banner(gam_connected: Optional[bool] = False):
+    """Print server banner.
+
+    Pass ``gam_connected=None`` when worker processes connect to GAM
+    themselves; each reports its status in the activity log.
+    """
+    if gam_connected is None:
+        gam_status, gam_network = "⚪ PER WORKER (see activity log)", "N/A"
+    else:
+        gam_status = "🟢 LIVE" if gam_connected else "🟡 SIMULATION"
+        gam_network = inventory.gam_network_code if gam_connected else "N/A"
+
+    if USE_RICH:
+        # BANNER is already boxed; formatting just fills in the GAM status
+        banner = BANNER.format(gam_status=gam_status, gam_network=gam_network)
+        get_console().print(banner, style="bold blue", end="")
     else:
-        print("\n" + "=" * 60)
-        print("PUBLISHER SELLER AGENT - GAM Integration")
-        print("=" * 60)
-        print(f"Port: 8001")
-        print(f"GAM Status: {gam_status}")
-        print(f"GAM Network: {gam_network}")
-        print("=" * 60 + "\n")
+        print(PLAIN_BANNER.format(gam_status=gam_status, gam_network=gam_network))
 
 
 def main():
     """Run the publisher MCP server."""
-    if RICH_AVAILABLE:
-        console.print("\n[bold cyan]Initializing Publisher Seller Agent...[/bold cyan]\n")
+    activity_log.start()
+
+    if USE_RICH:
+        get_console().print("\n[bold cyan]Initializing Publisher Seller Agent...[/bold cyan]\n")
 
-    # Initialize GAM connection
-    gam_connected = initialize_gam_connection()
+    # Orders, deals and the request log live in process memory, so each worker
+    # has its own copy; only raise PUBLISHER_WORKERS when that is acceptable
+    workers = int(os.getenv("PUBLISHER_WORKERS", "1"))
+
+    # Workers connect to GAM in their lifespan, so only a single-process run
+    # needs the connection here
+    gam_connected = None if workers > 1 else asyncio.run(initialize_gam_connection())
 
     # Print banner with GAM status
     print_banner(gam_connected)
 
-    if RICH_AVAILABLE:
-        console.print("\n[bold green]Starting server...[/bold green]\n")
-        console.print("[dim]Activity log:[/dim]\n")
+    if USE_RICH:
+        get_console().print("\n[bold green]Starting server...[/bold green]\n")
+        get_console().print("[dim]Activity log:[/dim]\n")
+
+    uvicorn.run(
+        "publisher_gam_server:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8001,
+        log_level="warning",
+        access_log=False,  # log_event already records every tool call
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+        workers=workers,
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
 
-    uvicorn.run(app, host="0.0.0.0", port=8001, log_level="warning")
+    # Flush anything still queued for the terminal
+    activity_log.stop()
 
 
 if __name__ == "__main__":
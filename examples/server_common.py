@@ -0,0 +1,195 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Helpers shared by the example MCP servers (dsp_server, publisher_gam_server)."""
+
+import hashlib
+import importlib.util
+import itertools
+import logging
+import logging.handlers
+import queue
+import re
+import secrets
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+# =============================================================================
+# Terminal Output
+# =============================================================================
+
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+# Styling is wasted on piped/redirected output (CI logs, recordings); use plain prints there
+USE_RICH = RICH_AVAILABLE and sys.stdout.isatty()
+
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# =============================================================================
+# IDs and Timestamps
+# =============================================================================
+
+# Per-process random prefix plus a counter: unique IDs without a urandom call each
+_ID_PREFIX = secrets.token_hex(3).upper()
+_id_counter = itertools.count()
+
+
+def new_id() -> str:
+    """Return a short uppercase hex ID, unique within this process."""
+    return f"{_ID_PREFIX}{next(_id_counter):05X}"
+
+
+# [epoch second, ISO timestamp, HH:MM:SS, YYYYMMDD_HHMMSS] for the last second formatted
+_clock_cache = [-1, "", "", ""]
+
+
+def _refresh_clock() -> list:
+    """Reformat the cached timestamps only when the wall-clock second changes."""
+    sec = int(time.time())
+    if sec != _clock_cache[0]:
+        now = datetime.fromtimestamp(sec)
+        _clock_cache[:] = [sec, now.isoformat(), now.strftime("%H:%M:%S"), now.strftime("%Y%m%d_%H%M%S")]
+    return _clock_cache
+
+
+def iso_now() -> str:
+    """Current local time as an ISO 8601 string (second resolution)."""
+    return _refresh_clock()[1]
+
+
+def clock_now() -> str:
+    """Current local time as HH:MM:SS."""
+    return _refresh_clock()[2]
+
+
+def stamp_now() -> str:
+    """Current local time as YYYYMMDD_HHMMSS, e.g. for unique order names."""
+    return _refresh_clock()[3]
+
+
+# =============================================================================
+# Activity Log
+# =============================================================================
+
+class ConsoleLogHandler(logging.Handler):
+    """Render activity-log records to the terminal.
+
+    ``source_tags`` maps a record's source to its Rich markup; other sources
+    render green.
+    """
+
+    def __init__(self, source_tags: dict[str, str]):
+        super().__init__()
+        self.source_tags = source_tags
+
+    def emit(self, record: logging.LogRecord) -> None:
+        timestamp, source, message = record.timestamp, record.source, record.getMessage()
+        if USE_RICH:
+            tag = self.source_tags.get(source) or f"[green]{source}[/green]"
+            get_console().print(f"[dim]{timestamp}[/dim] {tag} → {message}")
+        else:
+            print(f"{timestamp} [{source}] {message}")
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock prepare() merges args into the message before enqueueing; the
+    queue here never leaves the process, so the record can go as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class ActivityLog:
+    """A server's terminal activity log, optionally rendered off the request path.
+
+    While the listener runs, request handlers only enqueue records and the
+    listener thread does the rendering. Until it starts (e.g. the app is served
+    without its lifespan) records render directly, so the queue can't grow unread.
+    """
+
+    def __init__(self, name: str, source_tags: dict[str, str]):
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = DeferredQueueHandler(self.queue)
+        self.console_handler = ConsoleLogHandler(source_tags)
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.console_handler)
+        self.listener = logging.handlers.QueueListener(self.queue, self.console_handler)
+
+    def start(self) -> None:
+        """Move console rendering onto the listener thread."""
+        self.listener.start()
+        self.logger.addHandler(self.queue_handler)
+        self.logger.removeHandler(self.console_handler)
+
+    def stop(self) -> None:
+        """Render on the calling thread again and flush what is still queued."""
+        self.logger.addHandler(self.console_handler)
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+
+    def log(self, timestamp: str, source: str, message: str, *args) -> None:
+        """Log a %-format message, merged with args only when rendered."""
+        self.logger.info(message, *args, extra={"timestamp": timestamp, "source": source})
+
+
+# =============================================================================
+# Conditional GET
+# =============================================================================
+
+def etag_for(body: bytes) -> str:
+    """ETag for an encoded response body.
+
+    Weak, because GZipMiddleware may send the same body gzip-encoded and a
+    strong tag would have to differ per encoding.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+# Entity tags in an If-None-Match list: optional W/ prefix, then a quoted opaque tag
+_ETAG_LIST_RE = re.compile(r'(?:W/)?"[^"]*"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag, by weak comparison (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in _ETAG_LIST_RE.findall(if_none_match))
+
+
+def cached_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    media_type: str = "application/json",
+    vary: Optional[str] = None,
+) -> Response:
+    """Serve pre-encoded bytes, or 304 when the client already holds this version."""
+    headers = {"ETag": etag}
+    if vary:
+        headers["Vary"] = vary
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -8,7 +8,13 @@ from .opendirect21_client import OpenDirect21Client
 from .a2a_client import A2AClient, A2AResponse
 from .ucp_client import UCPClient, UCPExchangeResult
 from .gam_rest_client import GAMRestClient
-from .gam_soap_client import GAMSoapClient
+from .gam_soap_client import (
+    GAMSoapClient,
+    get_gam_soap_client,
+    handle_gam_error,
+    is_gam_connection_error,
+    reset_gam_soap_client,
+)
 
 __all__ = [
     "Protocol",
@@ -23,4 +29,8 @@ __all__ = [
     # GAM clients
     "GAMRestClient",
     "GAMSoapClient",
+    "get_gam_soap_client",
+    "reset_gam_soap_client",
+    "is_gam_connection_error",
+    "handle_gam_error",
 ]
@@ -7,6 +7,7 @@ Provides methods for writing to GAM using the SOAP API.
 Used for creating orders, line items, and managing audience segments.
 """
 
+import threading
 from datetime import datetime
 from typing import Any, Optional
 
@@ -63,8 +64,11 @@ class GAMSoapClient:
         self.application_name = settings.gam_application_name
         self.api_version = settings.gam_api_version
         self.default_trafficker_id = settings.gam_default_trafficker_id
+        self.wsdl_cache_path = settings.gam_wsdl_cache_path
 
         self._client: Optional[Any] = None
+        self._services: dict[str, Any] = {}
+        self._services_lock = threading.Lock()
 
     def connect(self) -> None:
         """Connect to GAM SOAP API."""
@@ -84,12 +88,21 @@ class GAMSoapClient:
                 oauth2.GetAPIScope("ad_manager"),
             )
 
+            # Optionally keep WSDLs on disk so a restart doesn't re-download them
+            cache = None
+            if self.wsdl_cache_path:
+                from zeep.cache import SqliteCache
+
+                cache = SqliteCache(path=self.wsdl_cache_path, timeout=86400)
+
             # Create Ad Manager client
             self._client = ad_manager.AdManagerClient(
                 oauth2_client,
                 self.application_name,
                 network_code=self.network_code,
+                cache=cache,
             )
+            self._services = {}
         except ImportError:
             raise ImportError(
                 "GAM SOAP client requires googleads. "
@@ -99,6 +112,7 @@ class GAMSoapClient:
     def disconnect(self) -> None:
         """Disconnect from GAM SOAP API."""
         self._client = None
+        self._services = {}
 
     def _ensure_connected(self) -> None:
         """Ensure the client is connected."""
@@ -106,9 +120,21 @@ class GAMSoapClient:
             raise RuntimeError("GAM SOAP client not connected. Call connect() first.")
 
     def _get_service(self, service_name: str) -> Any:
-        """Get a GAM service by name."""
+        """Get a GAM service by name.
+
+        Each GetService call parses the WSDL and opens a new HTTP session, so
+        services are created once and reused; their sessions keep connections
+        to GAM alive between calls.
+        """
         self._ensure_connected()
-        return self._client.GetService(service_name, version=self.api_version)
+        service = self._services.get(service_name)
+        if service is None:
+            with self._services_lock:
+                service = self._services.get(service_name)
+                if service is None:
+                    service = self._client.GetService(service_name, version=self.api_version)
+                    self._services[service_name] = service
+        return service
 
     # =========================================================================
     # Company Operations
@@ -202,7 +228,47 @@ class GAMSoapClient:
             The created order
         """
         order_service = self._get_service("OrderService")
+        order = self._build_order(
+            name=name,
+            advertiser_id=advertiser_id,
+            trafficker_id=trafficker_id,
+            agency_id=agency_id,
+            notes=notes,
+            external_order_id=external_order_id,
+            is_programmatic=is_programmatic,
+        )
+
+        result = order_service.createOrders([order])
+        order_data = result[0]
+
+        # Use the shared _parse_order method
+        return self._parse_order(order_data)
+
+    def create_orders(self, orders: list[dict[str, Any]]) -> list[GAMOrder]:
+        """Create several orders in a single OrderService round-trip.
+
+        Args:
+            orders: One dict per order, holding the keyword arguments
+                accepted by create_order (name, advertiser_id, ...)
+
+        Returns:
+            The created orders, in the same order as the input
+        """
+        order_service = self._get_service("OrderService")
+        result = order_service.createOrders([self._build_order(**spec) for spec in orders])
+        return [self._parse_order(order_data) for order_data in result]
 
+    def _build_order(
+        self,
+        name: str,
+        advertiser_id: str,
+        trafficker_id: Optional[str] = None,
+        agency_id: Optional[str] = None,
+        notes: Optional[str] = None,
+        external_order_id: Optional[str] = None,
+        is_programmatic: bool = False,
+    ) -> dict[str, Any]:
+        """Build the SOAP payload for a new order."""
         # Use default trafficker if not specified
         trafficker = trafficker_id or self.default_trafficker_id
         if not trafficker:
@@ -227,11 +293,7 @@ class GAMSoapClient:
         if external_order_id:
             order["externalOrderId"] = external_order_id
 
-        result = order_service.createOrders([order])
-        order_data = result[0]
-
-        # Use the shared _parse_order method
-        return self._parse_order(order_data)
+        return order
 
     def approve_order(self, order_id: str) -> GAMOrder:
         """Approve an order (submit for delivery).
@@ -260,6 +322,30 @@ class GAMSoapClient:
 
         return self._parse_order(order_data)
 
+    def approve_orders(self, order_ids: list[str]) -> list[GAMOrder]:
+        """Approve several orders with a single ApproveOrders action.
+
+        Args:
+            order_ids: The order IDs
+
+        Returns:
+            The updated orders (GAM does not guarantee input order)
+        """
+        order_service = self._get_service("OrderService")
+
+        # One action covers every order in the IN clause
+        action = {"xsi_type": "ApproveOrders"}
+        id_list = ", ".join(str(int(order_id)) for order_id in order_ids)
+        statement = f"WHERE id IN ({id_list})"
+
+        order_service.performOrderAction(action, {"query": statement})
+
+        # Fetch updated orders
+        response = order_service.getOrdersByStatement({"query": statement})
+        # ZEEP returns objects - use getattr
+        results = getattr(response, "results", None) or []
+        return [self._parse_order(order_data) for order_data in results]
+
     def _parse_order(self, data: Any) -> GAMOrder:
         """Parse SOAP response (ZEEP object) into GAMOrder model."""
         # ZEEP returns objects - use getattr instead of dict access
@@ -320,7 +406,58 @@ class GAMSoapClient:
             The created line item
         """
         line_item_service = self._get_service("LineItemService")
+        line_item = self._build_line_item(
+            order_id=order_id,
+            name=name,
+            line_item_type=line_item_type,
+            targeting=targeting,
+            cost_per_unit=cost_per_unit,
+            goal=goal,
+            start_time=start_time,
+            end_time=end_time,
+            cost_type=cost_type,
+            creative_sizes=creative_sizes,
+            external_id=external_id,
+            notes=notes,
+        )
+
+        result = line_item_service.createLineItems([line_item])
+        line_item_data = result[0]
+
+        return self._parse_line_item(line_item_data)
+
+    def create_line_items(self, line_items: list[dict[str, Any]]) -> list[GAMLineItem]:
+        """Create several line items in a single LineItemService round-trip.
+
+        Args:
+            line_items: One dict per line item, holding the keyword arguments
+                accepted by create_line_item (order_id, name, ...)
+
+        Returns:
+            The created line items, in the same order as the input
+        """
+        line_item_service = self._get_service("LineItemService")
+        result = line_item_service.createLineItems(
+            [self._build_line_item(**spec) for spec in line_items]
+        )
+        return [self._parse_line_item(line_item_data) for line_item_data in result]
 
+    def _build_line_item(
+        self,
+        order_id: str,
+        name: str,
+        line_item_type: GAMLineItemType,
+        targeting: GAMTargeting,
+        cost_per_unit: GAMMoney,
+        goal: GAMGoal,
+        start_time: datetime,
+        end_time: datetime,
+        cost_type: GAMCostType = GAMCostType.CPM,
+        creative_sizes: Optional[list[tuple[int, int]]] = None,
+        external_id: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Build the SOAP payload for a new line item."""
         # Build targeting
         targeting_dict: dict[str, Any] = {}
 
@@ -376,10 +513,7 @@ class GAMSoapClient:
         if notes:
             line_item["notes"] = notes
 
-        result = line_item_service.createLineItems([line_item])
-        line_item_data = result[0]
-
-        return self._parse_line_item(line_item_data)
+        return line_item
 
     def update_line_item(
         self,
@@ -653,3 +787,103 @@ class GAMSoapClient:
         """
         user_service = self._get_service("UserService")
         return user_service.getCurrentUser()
+
+
+_shared_clients: dict[tuple[str, str], GAMSoapClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_gam_soap_client(network_code: str, credentials_path: str) -> GAMSoapClient:
+    """Get a connected GAM SOAP client shared by all callers with the same credentials.
+
+    Connecting loads the service account key and builds the Ad Manager client,
+    and each client keeps its GAM services (and their HTTP connections) alive,
+    so tools reuse one client instead of connecting per call.
+
+    Thread safety: crewai runs tools on worker threads, so the shared client is
+    used concurrently. Connecting happens once under a lock and services are
+    created under the client's lock; the SOAP calls themselves rely on the
+    googleads/zeep services tolerating concurrent requests over their HTTP
+    session, and hold no lock. Call handle_gam_error() when a call fails so an
+    unusable client is replaced, or reset_gam_soap_client() after rotating
+    credentials.
+
+    Args:
+        network_code: GAM network code
+        credentials_path: Path to service account JSON key
+
+    Returns:
+        Connected GAMSoapClient
+    """
+    key = (network_code, credentials_path)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = GAMSoapClient(network_code=network_code, credentials_path=credentials_path)
+            client.connect()
+            _shared_clients[key] = client
+        return client
+
+
+def reset_gam_soap_client(
+    network_code: Optional[str] = None,
+    credentials_path: Optional[str] = None,
+) -> None:
+    """Disconnect and drop shared clients so the next get_gam_soap_client() reconnects.
+
+    Args:
+        network_code: GAM network code of the client to drop
+        credentials_path: Path to service account JSON key of the client to drop.
+            With neither given, every shared client is dropped.
+    """
+    with _shared_clients_lock:
+        if network_code is None and credentials_path is None:
+            dropped = list(_shared_clients.values())
+            _shared_clients.clear()
+        else:
+            client = _shared_clients.pop((network_code, credentials_path), None)
+            dropped = [client] if client else []
+    for client in dropped:
+        client.disconnect()
+
+
+def is_gam_connection_error(exc: BaseException) -> bool:
+    """Whether exc means a client's connection or credentials can no longer be used.
+
+    Transport failures from requests/urllib3 subclass OSError; expired or
+    revoked credentials surface as google-auth errors or as GAM faults
+    carrying an AuthenticationError.
+    """
+    if isinstance(exc, OSError):
+        return True
+    try:
+        from googleads.errors import GoogleAdsServerFault
+    except ImportError:
+        pass
+    else:
+        if isinstance(exc, GoogleAdsServerFault):
+            return any(
+                str(getattr(error, "errorString", "")).startswith("AuthenticationError.")
+                for error in exc.errors or ()
+            )
+    try:
+        from google.auth.exceptions import GoogleAuthError
+    except ImportError:
+        return False
+    return isinstance(exc, GoogleAuthError)
+
+
+def handle_gam_error(exc: BaseException, network_code: str, credentials_path: str) -> None:
+    """Replace the shared client for these credentials if exc left it unusable.
+
+    A dead connection or expired credentials would fail every later call
+    too, so the client is dropped and the next caller reconnects. Other
+    errors (bad requests, validation faults) leave the client in place.
+
+    Args:
+        exc: Exception raised while using the shared client
+        network_code: GAM network code the client was fetched with
+        credentials_path: Path to service account JSON key the client was fetched with
+    """
+    if is_gam_connection_error(exc):
+        reset_gam_soap_client(network_code, credentials_path)
@@ -64,6 +64,7 @@ class Settings(BaseSettings):
     gam_application_name: str = "AdSellerSystem"  # Application name for GAM API
     gam_api_version: str = "v202411"  # SOAP API version
     gam_default_trafficker_id: Optional[str] = None  # Default trafficker user ID
+    gam_wsdl_cache_path: Optional[str] = None  # SQLite file for caching GAM WSDLs across restarts
 
     # FreeWheel Configuration (alternative ad server)
     freewheel_api_url: Optional[str] = None
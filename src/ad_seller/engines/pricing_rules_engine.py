@@ -10,6 +10,7 @@ Evaluates pricing based on:
 - Volume commitments and loyalty tiers
 """
 
+import bisect
 from typing import Any, Optional
 
 from ..models.buyer_identity import BuyerContext, AccessTier
@@ -23,6 +24,11 @@ from ..models.pricing_tiers import (
 from ..models.flow_state import PricingDecision
 from ..models.core import DealType, PricingModel
 
+# Default volume ladder used when no rule grants a volume discount.
+# _DEFAULT_VOLUME_RATES[i] applies when volume has reached i thresholds.
+_DEFAULT_VOLUME_THRESHOLDS = (5_000_000, 10_000_000, 20_000_000, 50_000_000)
+_DEFAULT_VOLUME_RATES = (0.0, 0.05, 0.10, 0.15, 0.20)
+
 
 class PricingRulesEngine:
     """Engine for computing tiered pricing based on buyer identity.
@@ -190,14 +196,9 @@ class PricingRulesEngine:
 
         # Default volume tiers if no rules
         if max_discount == 0.0:
-            if volume >= 50_000_000:
-                max_discount = 0.20
-            elif volume >= 20_000_000:
-                max_discount = 0.15
-            elif volume >= 10_000_000:
-                max_discount = 0.10
-            elif volume >= 5_000_000:
-                max_discount = 0.05
+            max_discount = _DEFAULT_VOLUME_RATES[
+                bisect.bisect_right(_DEFAULT_VOLUME_THRESHOLDS, volume)
+            ]
 
         return max_discount
 
@@ -9,6 +9,7 @@ This flow handles:
 - Output: Deal ID + pricing (floor or fixed) - NO budget in deal
 """
 
+import secrets
 import uuid
 from datetime import datetime
 from typing import Any, Optional
@@ -110,7 +111,7 @@ class DealGenerationFlow(Flow[DealGenerationState]):
 
         # Generate Deal ID with seller prefix
         seller_prefix = self.state.seller_organization_id[:4] if self.state.seller_organization_id else "SELL"
-        deal_id = f"{seller_prefix}-{uuid.uuid4().hex[:12].upper()}"
+        deal_id = f"{seller_prefix}-{secrets.token_hex(6).upper()}"
 
         self.state.proposal_data["generated_deal_id"] = deal_id
 
@@ -13,8 +13,9 @@ Critical for migration period and ongoing compatibility with
 traditional DSPs (TTD, Amazon DSP, DV360).
 """
 
+import secrets
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from crewai.flow.flow import Flow, start, listen
@@ -30,6 +31,24 @@ from ..models.core import DealType, PricingModel
 from ..config import get_settings
 
 
+# Base CPM by product type
+BASE_PRICES = {
+    "display": 12.0,
+    "video": 25.0,
+    "ctv": 35.0,
+    "mobile_app": 18.0,
+    "native": 10.0,
+}
+
+# Discount off base CPM by buyer access tier
+TIER_DISCOUNTS = {
+    AccessTier.PUBLIC: 0.0,
+    AccessTier.SEAT: 0.05,
+    AccessTier.AGENCY: 0.10,
+    AccessTier.ADVERTISER: 0.15,
+}
+
+
 class NonAgenticState(SellerFlowState):
     """State for non-agentic DSP flow."""
 
@@ -163,26 +182,10 @@ class NonAgenticDSPFlow(Flow[NonAgenticState]):
         tier = AccessTier(self.state.parsed_request.get("access_tier", "public"))
         product_type = self.state.parsed_request.get("product_type", "display")
 
-        # Base prices by product type
-        base_prices = {
-            "display": 12.0,
-            "video": 25.0,
-            "ctv": 35.0,
-            "mobile_app": 18.0,
-            "native": 10.0,
-        }
-
-        base_price = base_prices.get(product_type, 12.0)
+        base_price = BASE_PRICES.get(product_type, 12.0)
 
         # Apply tier discounts
-        tier_discounts = {
-            AccessTier.PUBLIC: 0.0,
-            AccessTier.SEAT: 0.05,
-            AccessTier.AGENCY: 0.10,
-            AccessTier.ADVERTISER: 0.15,
-        }
-
-        discount = tier_discounts.get(tier, 0.0)
+        discount = TIER_DISCOUNTS.get(tier, 0.0)
         final_price = base_price * (1 - discount)
 
         self.state.pricing_decisions[product_type] = PricingDecision(
@@ -213,7 +216,7 @@ class NonAgenticDSPFlow(Flow[NonAgenticState]):
 
         # Generate Deal ID
         seller_prefix = (self.state.seller_organization_id or "SELL")[:4].upper()
-        deal_id = f"{seller_prefix}-{uuid.uuid4().hex[:12].upper()}"
+        deal_id = f"{seller_prefix}-{secrets.token_hex(6).upper()}"
 
         # Determine deal type enum
         deal_type_str = self.state.parsed_request.get("deal_type", "preferred_deal")
@@ -225,6 +228,7 @@ class NonAgenticDSPFlow(Flow[NonAgenticState]):
         deal_type = deal_type_map.get(deal_type_str, DealType.PREFERRED_DEAL)
 
         # Create deal output
+        now = datetime.utcnow()
         self.state.deal_output = DealOutput(
             deal_id=deal_id,
             deal_type=deal_type,
@@ -234,8 +238,8 @@ class NonAgenticDSPFlow(Flow[NonAgenticState]):
             pricing_model=PricingModel.CPM,
             buyer_organization_id=self.state.buyer_context.identity.agency_id or "human-buyer",
             seller_organization_id=self.state.seller_organization_id or "default-seller",
-            flight_start=datetime.utcnow().strftime("%Y-%m-%d"),
-            flight_end=(datetime.utcnow().replace(month=datetime.utcnow().month + 1)).strftime("%Y-%m-%d"),
+            flight_start=now.strftime("%Y-%m-%d"),
+            flight_end=(now + timedelta(days=30)).strftime("%Y-%m-%d"),
             activation_type="traditional_dsp",
             dsp_compatible=True,
         )
@@ -317,13 +321,54 @@ Ready to create a deal? Just let me know and I'll generate a Deal ID for you.
         Returns:
             Response with deal info or inquiry response
         """
-        self.state.request_text = request_text
-        self.state.buyer_context = buyer_context
-        self.state.seller_organization_id = seller_organization_id or self._settings.seller_organization_id or ""
+        self._prepare_request(request_text, buyer_context, seller_organization_id)
 
         # Run the flow
         self.kickoff()
 
+        return self._request_result()
+
+    async def aprocess_request(
+        self,
+        request_text: str,
+        buyer_context: Optional[BuyerContext] = None,
+        seller_organization_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Async variant of process_request for callers already on an event loop.
+
+        Concurrent requests need separate flow instances, since each run
+        keeps its working data in the flow state.
+        """
+        self._prepare_request(request_text, buyer_context, seller_organization_id)
+
+        # Run the flow
+        await self.kickoff_async()
+
+        return self._request_result()
+
+    def _prepare_request(
+        self,
+        request_text: str,
+        buyer_context: Optional[BuyerContext],
+        seller_organization_id: Optional[str],
+    ) -> None:
+        """Load a new request into the flow state."""
+        # Clear request-scoped state so one flow instance can serve many requests
+        # (deals stay, as the flow's running deal book)
+        self.state.status = ExecutionStatus.INITIALIZED
+        self.state.completed_at = None
+        self.state.parsed_request = {}
+        self.state.pricing_decisions = {}
+        self.state.response_text = ""
+        self.state.deal_output = None
+        self.state.errors = []
+
+        self.state.request_text = request_text
+        self.state.buyer_context = buyer_context
+        self.state.seller_organization_id = seller_organization_id or self._settings.seller_organization_id or ""
+
+    def _request_result(self) -> dict[str, Any]:
+        """Summarize the finished run for the caller."""
         return {
             "request_type": self.state.request_type,
             "response": self.state.response_text,
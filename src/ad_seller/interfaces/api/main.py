@@ -10,6 +10,7 @@ Provides endpoints for:
 - Deal generation
 """
 
+import asyncio
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -126,7 +127,7 @@ async def list_products():
     from ...flows import ProductSetupFlow
 
     flow = ProductSetupFlow()
-    await flow.kickoff()
+    await flow.kickoff_async()
 
     products = []
     for product in flow.state.products.values():
@@ -149,7 +150,7 @@ async def get_product(product_id: str):
     from ...flows import ProductSetupFlow
 
     flow = ProductSetupFlow()
-    await flow.kickoff()
+    await flow.kickoff_async()
 
     product = flow.state.products.get(product_id)
     if not product:
@@ -176,7 +177,7 @@ async def get_pricing(request: PricingRequest):
 
     # Get products
     flow = ProductSetupFlow()
-    await flow.kickoff()
+    await flow.kickoff_async()
 
     product = flow.state.products.get(request.product_id)
     if not product:
@@ -231,7 +232,7 @@ async def submit_proposal(request: ProposalRequest):
 
     # Get products
     setup_flow = ProductSetupFlow()
-    await setup_flow.kickoff()
+    await setup_flow.kickoff_async()
 
     # Create buyer context
     identity = BuyerIdentity(
@@ -255,8 +256,11 @@ async def submit_proposal(request: ProposalRequest):
         "buyer_id": request.buyer_id,
     }
 
+    # Flow helpers kick off synchronously (and may call an LLM), so keep
+    # them off the event loop
     flow = ProposalHandlingFlow()
-    result = flow.handle_proposal(
+    result = await asyncio.to_thread(
+        flow.handle_proposal,
         proposal_id=proposal_id,
         proposal_data=proposal_data,
         buyer_context=context,
@@ -278,7 +282,8 @@ async def generate_deal(request: DealRequest):
     from ...flows import DealGenerationFlow
 
     flow = DealGenerationFlow()
-    result = flow.generate_deal(
+    result = await asyncio.to_thread(
+        flow.generate_deal,
         proposal_id=request.proposal_id,
         proposal_data={
             "status": "accepted",
@@ -312,7 +317,7 @@ async def discovery_query(request: DiscoveryRequest):
 
     # Get products
     setup_flow = ProductSetupFlow()
-    await setup_flow.kickoff()
+    await setup_flow.kickoff_async()
 
     # Create buyer context
     tier_map = {
@@ -330,7 +335,8 @@ async def discovery_query(request: DiscoveryRequest):
 
     # Process discovery
     flow = DiscoveryInquiryFlow()
-    response = flow.query(
+    response = await asyncio.to_thread(
+        flow.query,
         query=request.query,
         buyer_context=context,
         products=setup_flow.state.products,
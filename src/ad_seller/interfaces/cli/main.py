@@ -24,6 +24,12 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 app = typer.Typer(
     name="ad-seller",
     help="Ad Seller System CLI - Manage publisher inventory and deals",
@@ -31,6 +37,13 @@ app = typer.Typer(
 console = Console()
 
 
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 @app.command()
 def init(
     organization_name: str = typer.Option(
@@ -46,7 +59,7 @@ def init(
     console.print(Panel("Initializing Ad Seller System...", title="Setup"))
 
     flow = ProductSetupFlow()
-    asyncio.run(flow.kickoff())
+    _run(flow.kickoff_async())
 
     console.print(f"[green]✓[/green] Organization '{organization_name}' initialized")
     console.print(f"[green]✓[/green] Created {len(flow.state.products)} default products")
@@ -75,7 +88,7 @@ def catalog():
     from ...flows import ProductSetupFlow
 
     flow = ProductSetupFlow()
-    asyncio.run(flow.kickoff())
+    _run(flow.kickoff_async())
 
     table = Table(title="Product Catalog")
     table.add_column("ID", style="cyan")
@@ -113,7 +126,7 @@ def price(
 
     # Get products
     flow = ProductSetupFlow()
-    asyncio.run(flow.kickoff())
+    _run(flow.kickoff_async())
 
     product = flow.state.products.get(product_id)
     if not product:
@@ -222,7 +235,7 @@ def connect(
         except Exception as e:
             console.print(f"[red]✗ Connection error: {e}[/red]")
 
-    asyncio.run(test_connection())
+    _run(test_connection())
 
 
 @app.command()
@@ -159,123 +159,116 @@ class BookDealInGAMTool(BaseTool):
         line_item_type = deal_type_map.get(deal_type_lower, GAMLineItemType.STANDARD)
 
         try:
-            from ...clients import GAMSoapClient
+            from ...clients import get_gam_soap_client, handle_gam_error
 
             # Parse dates
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            start_dt = datetime.fromisoformat(start_date)
+            end_dt = datetime.fromisoformat(end_date)
 
-            client = GAMSoapClient(
-                network_code=settings.gam_network_code,
-                credentials_path=settings.gam_json_key_path,
+            client = get_gam_soap_client(settings.gam_network_code, settings.gam_json_key_path)
+
+            # Step 1: Get or create advertiser
+            advertiser_id = client.get_or_create_advertiser(
+                name=advertiser_name,
+                external_id=deal_id,
             )
-            client.connect()
 
-            try:
-                # Step 1: Get or create advertiser
-                advertiser_id = client.get_or_create_advertiser(
-                    name=advertiser_name,
-                    external_id=deal_id,
-                )
+            # Step 2: Create order
+            order = client.create_order(
+                name=f"{campaign_name} - {deal_id}",
+                advertiser_id=advertiser_id,
+                notes=f"OpenDirect Deal: {deal_id}",
+                external_order_id=deal_id,
+                is_programmatic=True,
+            )
 
-                # Step 2: Create order
-                order = client.create_order(
-                    name=f"{campaign_name} - {deal_id}",
-                    advertiser_id=advertiser_id,
-                    notes=f"OpenDirect Deal: {deal_id}",
-                    external_order_id=deal_id,
-                    is_programmatic=True,
-                )
+            # Step 3: Build targeting
+            inventory_targeting = GAMInventoryTargeting(
+                targeted_ad_units=[
+                    GAMAdUnitTargeting(ad_unit_id=uid, include_descendants=True)
+                    for uid in ad_unit_ids
+                ]
+            )
+            targeting = GAMTargeting(inventory_targeting=inventory_targeting)
 
-                # Step 3: Build targeting
-                inventory_targeting = GAMInventoryTargeting(
-                    targeted_ad_units=[
-                        GAMAdUnitTargeting(ad_unit_id=uid, include_descendants=True)
-                        for uid in ad_unit_ids
-                    ]
-                )
-                targeting = GAMTargeting(inventory_targeting=inventory_targeting)
-
-                # Add audience targeting if provided
-                if audience_segment_ids:
-                    from ...models.gam import GAMAudienceSegmentCriteria, GAMCustomCriteriaSet
-
-                    audience_criteria = GAMAudienceSegmentCriteria(
-                        operator="IS",
-                        audience_segment_ids=audience_segment_ids,
-                    )
-                    targeting.custom_targeting = GAMCustomCriteriaSet(
-                        logical_operator="AND",
-                        children=[audience_criteria],
-                    )
-
-                # Step 4: Create line item
-                cost_per_unit = GAMMoney(
-                    currency_code=currency,
-                    micro_amount=int(cpm_rate * 1_000_000),
-                )
-                goal = GAMGoal(
-                    goal_type=GAMGoalType.LIFETIME,
-                    unit_type=GAMUnitType.IMPRESSIONS,
-                    units=impressions,
-                )
+            # Add audience targeting if provided
+            if audience_segment_ids:
+                from ...models.gam import GAMAudienceSegmentCriteria, GAMCustomCriteriaSet
 
-                line_item = client.create_line_item(
-                    order_id=order.id,
-                    name=f"Line - {deal_id}",
-                    line_item_type=line_item_type,
-                    targeting=targeting,
-                    cost_per_unit=cost_per_unit,
-                    goal=goal,
-                    start_time=start_dt,
-                    end_time=end_dt,
-                    cost_type=cost_type,
-                    external_id=deal_id,
+                audience_criteria = GAMAudienceSegmentCriteria(
+                    operator="IS",
+                    audience_segment_ids=audience_segment_ids,
                 )
-
-                # Format booking result
-                result = GAMBookingResult(
-                    success=True,
-                    order_id=order.id,
-                    line_item_id=line_item.id,
-                    deal_id=deal_id,
-                    status="BOOKED",
-                    message="Deal successfully booked in GAM",
+                targeting.custom_targeting = GAMCustomCriteriaSet(
+                    logical_operator="AND",
+                    children=[audience_criteria],
                 )
 
-                lines = [
-                    f"Deal booked successfully in GAM:\n",
-                    f"- OpenDirect Deal ID: {deal_id}",
-                    f"- Deal Type: {deal_type}",
-                    f"- GAM Order ID: {order.id}",
-                    f"- GAM Line Item ID: {line_item.id}",
-                    f"- Order Status: {order.status.value}",
-                    f"- Line Item Status: {line_item.status.value}",
-                    f"- Advertiser: {advertiser_name} (ID: {advertiser_id})",
-                    f"- Cost: ${cpm_rate:.2f} {currency} {cost_type.value}",
-                    f"- Goal: {impressions:,} impressions",
-                    f"- Flight: {start_date} to {end_date}",
-                    f"- Targeted ad units: {len(ad_unit_ids)}",
-                ]
+            # Step 4: Create line item
+            cost_per_unit = GAMMoney(
+                currency_code=currency,
+                micro_amount=int(cpm_rate * 1_000_000),
+            )
+            goal = GAMGoal(
+                goal_type=GAMGoalType.LIFETIME,
+                unit_type=GAMUnitType.IMPRESSIONS,
+                units=impressions,
+            )
 
-                if audience_segment_ids:
-                    lines.append(f"- Audience segments: {len(audience_segment_ids)}")
+            line_item = client.create_line_item(
+                order_id=order.id,
+                name=f"Line - {deal_id}",
+                line_item_type=line_item_type,
+                targeting=targeting,
+                cost_per_unit=cost_per_unit,
+                goal=goal,
+                start_time=start_dt,
+                end_time=end_dt,
+                cost_type=cost_type,
+                external_id=deal_id,
+            )
 
-                lines.append(
-                    f"\nNote: Order is in DRAFT status. Approve the order in GAM "
-                    f"to start delivery."
-                )
+            # Format booking result
+            result = GAMBookingResult(
+                success=True,
+                order_id=order.id,
+                line_item_id=line_item.id,
+                deal_id=deal_id,
+                status="BOOKED",
+                message="Deal successfully booked in GAM",
+            )
 
-                return "\n".join(lines)
+            lines = [
+                f"Deal booked successfully in GAM:\n",
+                f"- OpenDirect Deal ID: {deal_id}",
+                f"- Deal Type: {deal_type}",
+                f"- GAM Order ID: {order.id}",
+                f"- GAM Line Item ID: {line_item.id}",
+                f"- Order Status: {order.status.value}",
+                f"- Line Item Status: {line_item.status.value}",
+                f"- Advertiser: {advertiser_name} (ID: {advertiser_id})",
+                f"- Cost: ${cpm_rate:.2f} {currency} {cost_type.value}",
+                f"- Goal: {impressions:,} impressions",
+                f"- Flight: {start_date} to {end_date}",
+                f"- Targeted ad units: {len(ad_unit_ids)}",
+            ]
+
+            if audience_segment_ids:
+                lines.append(f"- Audience segments: {len(audience_segment_ids)}")
+
+            lines.append(
+                f"\nNote: Order is in DRAFT status. Approve the order in GAM "
+                f"to start delivery."
+            )
 
-            finally:
-                client.disconnect()
+            return "\n".join(lines)
 
         except ImportError as e:
             return f"GAM client dependencies not installed: {e}"
         except ValueError as e:
             return f"Configuration error: {e}"
         except Exception as e:
+            handle_gam_error(e, settings.gam_network_code, settings.gam_json_key_path)
             return f"Error booking deal: {e}"
 
     def _book_private_auction(
@@ -104,11 +104,11 @@ class CreateGAMLineItemTool(BaseTool):
             )
 
         try:
-            from ...clients import GAMSoapClient
+            from ...clients import get_gam_soap_client, handle_gam_error
 
             # Parse dates
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            start_dt = datetime.fromisoformat(start_date)
+            end_dt = datetime.fromisoformat(end_date)
 
             # Map line item type
             type_map = {
@@ -156,54 +156,47 @@ class CreateGAMLineItemTool(BaseTool):
                 units=impressions,
             )
 
-            client = GAMSoapClient(
-                network_code=settings.gam_network_code,
-                credentials_path=settings.gam_json_key_path,
+            client = get_gam_soap_client(settings.gam_network_code, settings.gam_json_key_path)
+
+            line_item = client.create_line_item(
+                order_id=order_id,
+                name=name,
+                line_item_type=li_type,
+                targeting=targeting,
+                cost_per_unit=cost_per_unit,
+                goal=goal,
+                start_time=start_dt,
+                end_time=end_dt,
+                cost_type=GAMCostType.CPM,
+                external_id=external_id,
             )
-            client.connect()
-
-            try:
-                line_item = client.create_line_item(
-                    order_id=order_id,
-                    name=name,
-                    line_item_type=li_type,
-                    targeting=targeting,
-                    cost_per_unit=cost_per_unit,
-                    goal=goal,
-                    start_time=start_dt,
-                    end_time=end_dt,
-                    cost_type=GAMCostType.CPM,
-                    external_id=external_id,
-                )
-
-                # Format response
-                lines = [
-                    f"Line item created successfully:\n",
-                    f"- Line Item ID: {line_item.id}",
-                    f"- Name: {line_item.name}",
-                    f"- Order ID: {line_item.order_id}",
-                    f"- Type: {line_item.line_item_type.value}",
-                    f"- Status: {line_item.status.value}",
-                    f"- Cost: ${cpm_rate:.2f} {currency} CPM",
-                    f"- Goal: {impressions:,} impressions",
-                    f"- Flight: {start_date} to {end_date}",
-                    f"- Targeted ad units: {len(ad_unit_ids)}",
-                ]
 
-                if audience_segment_ids:
-                    lines.append(f"- Audience segments: {len(audience_segment_ids)}")
+            # Format response
+            lines = [
+                f"Line item created successfully:\n",
+                f"- Line Item ID: {line_item.id}",
+                f"- Name: {line_item.name}",
+                f"- Order ID: {line_item.order_id}",
+                f"- Type: {line_item.line_item_type.value}",
+                f"- Status: {line_item.status.value}",
+                f"- Cost: ${cpm_rate:.2f} {currency} CPM",
+                f"- Goal: {impressions:,} impressions",
+                f"- Flight: {start_date} to {end_date}",
+                f"- Targeted ad units: {len(ad_unit_ids)}",
+            ]
 
-                if line_item.external_id:
-                    lines.append(f"- External ID: {line_item.external_id}")
+            if audience_segment_ids:
+                lines.append(f"- Audience segments: {len(audience_segment_ids)}")
 
-                return "\n".join(lines)
+            if line_item.external_id:
+                lines.append(f"- External ID: {line_item.external_id}")
 
-            finally:
-                client.disconnect()
+            return "\n".join(lines)
 
         except ImportError as e:
             return f"GAM SOAP client dependencies not installed: {e}"
         except ValueError as e:
             return f"Input error: {e}"
         except Exception as e:
+            handle_gam_error(e, settings.gam_network_code, settings.gam_json_key_path)
             return f"Error creating line item: {e}"
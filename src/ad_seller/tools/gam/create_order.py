@@ -67,52 +67,45 @@ class CreateGAMOrderTool(BaseTool):
             )
 
         try:
-            from ...clients import GAMSoapClient
+            from ...clients import get_gam_soap_client, handle_gam_error
 
-            client = GAMSoapClient(
-                network_code=settings.gam_network_code,
-                credentials_path=settings.gam_json_key_path,
+            client = get_gam_soap_client(settings.gam_network_code, settings.gam_json_key_path)
+
+            # Get or create advertiser company
+            advertiser_id = client.get_or_create_advertiser(advertiser_name)
+
+            # Create the order
+            order = client.create_order(
+                name=name,
+                advertiser_id=advertiser_id,
+                notes=notes,
+                external_order_id=external_order_id,
+                is_programmatic=True,
             )
-            client.connect()
-
-            try:
-                # Get or create advertiser company
-                advertiser_id = client.get_or_create_advertiser(advertiser_name)
-
-                # Create the order
-                order = client.create_order(
-                    name=name,
-                    advertiser_id=advertiser_id,
-                    notes=notes,
-                    external_order_id=external_order_id,
-                    is_programmatic=True,
-                )
-
-                # Format response
-                lines = [
-                    f"Order created successfully:\n",
-                    f"- Order ID: {order.id}",
-                    f"- Name: {order.name}",
-                    f"- Advertiser ID: {order.advertiser_id}",
-                    f"- Status: {order.status.value}",
-                ]
-
-                if order.external_order_id:
-                    lines.append(f"- External ID: {order.external_order_id}")
-
-                lines.append(
-                    f"\nNext step: Create line items using create_gam_line_item "
-                    f"with order_id={order.id}"
-                )
-
-                return "\n".join(lines)
-
-            finally:
-                client.disconnect()
+
+            # Format response
+            lines = [
+                f"Order created successfully:\n",
+                f"- Order ID: {order.id}",
+                f"- Name: {order.name}",
+                f"- Advertiser ID: {order.advertiser_id}",
+                f"- Status: {order.status.value}",
+            ]
+
+            if order.external_order_id:
+                lines.append(f"- External ID: {order.external_order_id}")
+
+            lines.append(
+                f"\nNext step: Create line items using create_gam_line_item "
+                f"with order_id={order.id}"
+            )
+
+            return "\n".join(lines)
 
         except ImportError as e:
             return f"GAM SOAP client dependencies not installed: {e}"
         except ValueError as e:
             return f"Configuration error: {e}"
         except Exception as e:
+            handle_gam_error(e, settings.gam_network_code, settings.gam_json_key_path)
             return f"Error creating order: {e}"
@@ -87,73 +87,66 @@ class ListAudienceSegmentsTool(BaseTool):
             )
 
         try:
-            from ...clients import GAMSoapClient
+            from ...clients import get_gam_soap_client, handle_gam_error
 
-            client = GAMSoapClient(
-                network_code=settings.gam_network_code,
-                credentials_path=settings.gam_json_key_path,
+            client = get_gam_soap_client(settings.gam_network_code, settings.gam_json_key_path)
+
+            # Build filter statement
+            filters = []
+            if name_filter:
+                filters.append(f"name LIKE '%{name_filter}%'")
+
+            filter_statement = " AND ".join(filters) if filters else None
+
+            segments = client.list_audience_segments(
+                filter_statement=filter_statement,
+                limit=limit,
             )
-            client.connect()
-
-            try:
-                # Build filter statement
-                filters = []
-                if name_filter:
-                    filters.append(f"name LIKE '%{name_filter}%'")
-
-                filter_statement = " AND ".join(filters) if filters else None
-
-                segments = client.list_audience_segments(
-                    filter_statement=filter_statement,
-                    limit=limit,
-                )
-
-                if not segments:
-                    return "No audience segments found matching the criteria."
-
-                # Filter by type if needed
-                if not include_third_party:
-                    segments = [
-                        s for s in segments
-                        if s.type.value != "THIRD_PARTY"
-                    ]
-
-                # Group by IAB category (inferred from segment name/description)
-                categorized = self._categorize_segments(segments, iab_category)
-
-                # Format results
-                lines = [f"Found {len(segments)} audience segment(s):\n"]
-
-                for category_name, category_segments in categorized.items():
-                    if category_segments:
-                        lines.append(f"\n{category_name}:")
-                        for seg in category_segments:
-                            size_str = f"{seg.size:,}" if seg.size else "Unknown"
-                            lines.append(
-                                f"  - {seg.name} (ID: {seg.id})\n"
-                                f"    Type: {seg.type.value}\n"
-                                f"    Status: {seg.status.value}\n"
-                                f"    Size: {size_str} members"
-                            )
-
-                lines.append(
-                    "\nTo use these segments, include their IDs in "
-                    "audience_segment_ids when creating line items."
-                )
-
-                # Add IAB taxonomy reference
-                lines.append("\nIAB Audience Taxonomy 1.1 Categories:")
-                for cat_id, cat_name in IAB_AUDIENCE_TAXONOMY_1_1.items():
-                    lines.append(f"  {cat_id}: {cat_name}")
-
-                return "\n".join(lines)
-
-            finally:
-                client.disconnect()
+
+            if not segments:
+                return "No audience segments found matching the criteria."
+
+            # Filter by type if needed
+            if not include_third_party:
+                segments = [
+                    s for s in segments
+                    if s.type.value != "THIRD_PARTY"
+                ]
+
+            # Group by IAB category (inferred from segment name/description)
+            categorized = self._categorize_segments(segments, iab_category)
+
+            # Format results
+            lines = [f"Found {len(segments)} audience segment(s):\n"]
+
+            for category_name, category_segments in categorized.items():
+                if category_segments:
+                    lines.append(f"\n{category_name}:")
+                    for seg in category_segments:
+                        size_str = f"{seg.size:,}" if seg.size else "Unknown"
+                        lines.append(
+                            f"  - {seg.name} (ID: {seg.id})\n"
+                            f"    Type: {seg.type.value}\n"
+                            f"    Status: {seg.status.value}\n"
+                            f"    Size: {size_str} members"
+                        )
+
+            lines.append(
+                "\nTo use these segments, include their IDs in "
+                "audience_segment_ids when creating line items."
+            )
+
+            # Add IAB taxonomy reference
+            lines.append("\nIAB Audience Taxonomy 1.1 Categories:")
+            for cat_id, cat_name in IAB_AUDIENCE_TAXONOMY_1_1.items():
+                lines.append(f"  {cat_id}: {cat_name}")
+
+            return "\n".join(lines)
 
         except ImportError as e:
             return f"GAM SOAP client dependencies not installed: {e}"
         except Exception as e:
+            handle_gam_error(e, settings.gam_network_code, settings.gam_json_key_path)
             return f"Error listing audience segments: {e}"
 
     def _categorize_segments(
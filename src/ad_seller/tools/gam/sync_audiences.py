@@ -127,95 +127,88 @@ class SyncGAMAudiencesTool(BaseTool):
             )
 
         try:
-            from ...clients import GAMSoapClient
+            from ...clients import get_gam_soap_client, handle_gam_error
             from datetime import datetime
 
-            client = GAMSoapClient(
-                network_code=settings.gam_network_code,
-                credentials_path=settings.gam_json_key_path,
-            )
-            client.connect()
-
-            try:
-                # Fetch all GAM segments
-                segments = client.list_audience_segments(limit=500)
-
-                if not include_third_party:
-                    segments = [
-                        s for s in segments
-                        if s.type.value != "THIRD_PARTY"
-                    ]
-
-                # Build mappings
-                mappings = []
-                iab_matches = 0
-                created_count = 0
-
-                for segment in segments:
-                    # Try to match to IAB Audience Taxonomy
-                    iab_id = self._match_to_iab_taxonomy(segment.name)
-
-                    mapping = AudienceSegmentMapping(
-                        gam_segment_id=segment.id,
-                        gam_segment_name=segment.name,
-                        segment_type=segment.type.value.lower().replace("_", "-"),
-                        last_synced=datetime.now(),
-                        estimated_size=segment.size,
-                        iab_audience_taxonomy_id=iab_id,
-                    )
-                    mappings.append(mapping)
-
-                    if iab_id:
-                        iab_matches += 1
-
-                # Create missing segments if requested
-                if create_missing:
-                    # Would create segments for common IAB taxonomy categories
-                    # that don't have corresponding GAM segments
-                    pass  # Implementation would create via SOAP API
-
-                # Format results
-                lines = [f"GAM Audience Sync Complete:\n"]
-                lines.append(f"- Total segments found: {len(segments)}")
-                lines.append(f"- First-party segments: {sum(1 for s in segments if 'FIRST' in s.type.value)}")
-                lines.append(f"- Third-party segments: {sum(1 for s in segments if 'THIRD' in s.type.value)}")
-                lines.append(f"- Mapped to IAB Taxonomy: {iab_matches}")
-
-                if update_mappings:
-                    lines.append(f"- Mappings updated: {len(mappings)}")
-
-                if create_missing:
-                    lines.append(f"- New segments created: {created_count}")
-
-                # Show sample mappings
-                lines.append("\nSample audience mappings:")
-                for mapping in mappings[:5]:
-                    iab_str = f" (IAB: {mapping.iab_audience_taxonomy_id})" if mapping.iab_audience_taxonomy_id else ""
-                    size_str = f"{mapping.estimated_size:,}" if mapping.estimated_size else "?"
-                    lines.append(
-                        f"  - {mapping.gam_segment_name}{iab_str}\n"
-                        f"    GAM ID: {mapping.gam_segment_id}, Size: {size_str}"
-                    )
-
-                if len(mappings) > 5:
-                    lines.append(f"  ... and {len(mappings) - 5} more")
-
-                # Add IAB taxonomy reference
-                lines.append("\nIAB Audience Taxonomy 1.1 top-level categories:")
-                lines.append("  1: Demographics | 2: Interest | 3: Purchase Intent")
-                lines.append("  4: Life Stage | 5: Seasonal & Event | 6: Behaviors")
+            client = get_gam_soap_client(settings.gam_network_code, settings.gam_json_key_path)
+
+            # Fetch all GAM segments
+            segments = client.list_audience_segments(limit=500)
+
+            if not include_third_party:
+                segments = [
+                    s for s in segments
+                    if s.type.value != "THIRD_PARTY"
+                ]
+
+            # Build mappings
+            mappings = []
+            iab_matches = 0
+            created_count = 0
+
+            for segment in segments:
+                # Try to match to IAB Audience Taxonomy
+                iab_id = self._match_to_iab_taxonomy(segment.name)
+
+                mapping = AudienceSegmentMapping(
+                    gam_segment_id=segment.id,
+                    gam_segment_name=segment.name,
+                    segment_type=segment.type.value.lower().replace("_", "-"),
+                    last_synced=datetime.now(),
+                    estimated_size=segment.size,
+                    iab_audience_taxonomy_id=iab_id,
+                )
+                mappings.append(mapping)
+
+                if iab_id:
+                    iab_matches += 1
+
+            # Create missing segments if requested
+            if create_missing:
+                # Would create segments for common IAB taxonomy categories
+                # that don't have corresponding GAM segments
+                pass  # Implementation would create via SOAP API
+
+            # Format results
+            lines = [f"GAM Audience Sync Complete:\n"]
+            lines.append(f"- Total segments found: {len(segments)}")
+            lines.append(f"- First-party segments: {sum(1 for s in segments if 'FIRST' in s.type.value)}")
+            lines.append(f"- Third-party segments: {sum(1 for s in segments if 'THIRD' in s.type.value)}")
+            lines.append(f"- Mapped to IAB Taxonomy: {iab_matches}")
+
+            if update_mappings:
+                lines.append(f"- Mappings updated: {len(mappings)}")
+
+            if create_missing:
+                lines.append(f"- New segments created: {created_count}")
+
+            # Show sample mappings
+            lines.append("\nSample audience mappings:")
+            for mapping in mappings[:5]:
+                iab_str = f" (IAB: {mapping.iab_audience_taxonomy_id})" if mapping.iab_audience_taxonomy_id else ""
+                size_str = f"{mapping.estimated_size:,}" if mapping.estimated_size else "?"
                 lines.append(
-                    "\nFull taxonomy: https://github.com/InteractiveAdvertisingBureau/Taxonomies"
+                    f"  - {mapping.gam_segment_name}{iab_str}\n"
+                    f"    GAM ID: {mapping.gam_segment_id}, Size: {size_str}"
                 )
 
-                return "\n".join(lines)
+            if len(mappings) > 5:
+                lines.append(f"  ... and {len(mappings) - 5} more")
+
+            # Add IAB taxonomy reference
+            lines.append("\nIAB Audience Taxonomy 1.1 top-level categories:")
+            lines.append("  1: Demographics | 2: Interest | 3: Purchase Intent")
+            lines.append("  4: Life Stage | 5: Seasonal & Event | 6: Behaviors")
+            lines.append(
+                "\nFull taxonomy: https://github.com/InteractiveAdvertisingBureau/Taxonomies"
+            )
 
-            finally:
-                client.disconnect()
+            return "\n".join(lines)
 
         except ImportError as e:
             return f"GAM SOAP client dependencies not installed: {e}"
         except Exception as e:
+            handle_gam_error(e, settings.gam_network_code, settings.gam_json_key_path)
             return f"Error syncing audiences: {e}"
 
     def _match_to_iab_taxonomy(self, segment_name: str) -> str | None:
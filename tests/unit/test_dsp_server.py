@@ -0,0 +1,136 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Unit tests for the DSP example server."""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+
+from examples import dsp_server as server
+
+
+class TestGetBulkPricing:
+    """Tests for the get_bulk_pricing tool."""
+
+    def test_quotes_requested_products(self):
+        """Test each requested product gets a quote, in request order."""
+        result = server.handle_get_bulk_pricing({"product_ids": ["mobile-app-001", "perf-display-001"]})
+
+        assert result["total"] == 2
+        assert [q["product_id"] for q in result["quotes"]] == ["mobile-app-001", "perf-display-001"]
+        assert [q["pricing_model"] for q in result["quotes"]] == ["CPI", "CPM"]
+
+    def test_defaults_to_whole_catalog(self):
+        """Test omitting product_ids quotes every product."""
+        result = server.handle_get_bulk_pricing({})
+
+        assert result["total"] == len(server.DSP_PRODUCTS)
+
+    @pytest.mark.parametrize("product_ids", ["perf-display-001", ["perf-display-001", 7], {"id": "x"}])
+    def test_rejects_non_list_product_ids(self, product_ids):
+        """Test product_ids must be a list of strings."""
+        result = server.handle_get_bulk_pricing({"product_ids": product_ids})
+
+        assert result == {"error": "product_ids must be a list of product ID strings"}
+
+
+class TestMCPCall:
+    """Tests for the /mcp/call endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        return TestClient(server.app)
+
+    def test_json_envelope(self, client):
+        """Test a JSON tool call returns the success envelope."""
+        response = client.post("/mcp/call", json={"name": "get_pricing", "arguments": {"product_id": "perf-display-001"}})
+
+        body = response.json()
+        assert body["success"] is True
+        assert body["tool"] == "get_pricing"
+        assert body["result"]["product_id"] == "perf-display-001"
+
+    def test_cbor_envelope(self, client):
+        """Test a tool call that asks for CBOR gets a decodable CBOR envelope."""
+        cbor2 = pytest.importorskip("cbor2")
+
+        response = client.post(
+            "/mcp/call",
+            json={"name": "list_products", "arguments": {"channel": "mobile"}},
+            headers={"Accept": "application/cbor"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/cbor"
+        body = cbor2.loads(response.content)
+        assert body["success"] is True
+        assert body["tool"] == "list_products"
+        assert {p["channel"] for p in body["result"]["products"]} == {"mobile"}
+
+
+class TestActivityLog:
+    """Tests for the activity-log queue."""
+
+    def test_logs_render_directly_until_listener_starts(self):
+        """Test records are not queued while no listener is draining the queue."""
+        server.log_event("MCP", "not queued")
+
+        assert server.activity_log.queue.empty()
+
+    def test_listener_drains_queue(self):
+        """Test records queue while the listener runs and are flushed on stop."""
+        log = server.activity_log
+        log.start()
+        try:
+            server.log_event("MCP", "queued")
+        finally:
+            log.stop()
+
+        assert log.queue.empty()
+        assert log.console_handler in log.logger.handlers
+        assert log.queue_handler not in log.logger.handlers
+
+
+class TestToolsETag:
+    """Tests for conditional GET /mcp/tools."""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        return TestClient(server.app)
+
+    def test_sends_etag_and_vary(self, client):
+        """Test the tool catalog carries a weak ETag and varies on Accept."""
+        response = client.get("/mcp/tools")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == server.TOOLS_ETAG
+        assert response.headers["etag"].startswith('W/"')
+        assert "Accept" in response.headers["vary"]
+        assert [t["name"] for t in response.json()["tools"]] == [t["name"] for t in server.MCP_TOOLS]
+
+    @pytest.mark.parametrize("if_none_match", [
+        lambda etag: etag,
+        lambda etag: etag.removeprefix("W/"),
+        lambda etag: f'"stale", {etag}',
+        lambda etag: "*",
+    ])
+    def test_not_modified(self, client, if_none_match):
+        """Test a matching If-None-Match (weak, listed or *) gets a bodiless 304."""
+        response = client.get("/mcp/tools", headers={"If-None-Match": if_none_match(server.TOOLS_ETAG)})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == server.TOOLS_ETAG
+
+    def test_mismatch_gets_body(self, client):
+        """Test a stale If-None-Match gets the full catalog."""
+        response = client.get("/mcp/tools", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["tools"]
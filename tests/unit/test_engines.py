@@ -82,6 +82,14 @@ class TestPricingRulesEngine:
         assert large_result.final_price < small_result.final_price
         assert large_result.volume_discount > 0
 
+    def test_default_volume_tier_boundaries(self, pricing_engine):
+        """Test default volume tiers apply from each threshold upward."""
+        assert pricing_engine._calculate_volume_discount(4_999_999, []) == 0.0
+        assert pricing_engine._calculate_volume_discount(5_000_000, []) == 0.05
+        assert pricing_engine._calculate_volume_discount(19_999_999, []) == 0.10
+        assert pricing_engine._calculate_volume_discount(20_000_000, []) == 0.15
+        assert pricing_engine._calculate_volume_discount(500_000_000, []) == 0.20
+
     def test_floor_price_enforcement(self, pricing_engine, advertiser_buyer_context):
         """Test floor price is never violated."""
         # Use a very low base price to test floor enforcement
@@ -8,7 +8,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from ad_seller.clients.gam_rest_client import GAMRestClient
-from ad_seller.clients.gam_soap_client import GAMSoapClient
+from ad_seller.clients.gam_soap_client import (
+    GAMSoapClient,
+    get_gam_soap_client,
+    handle_gam_error,
+    is_gam_connection_error,
+    reset_gam_soap_client,
+)
 from ad_seller.models.gam import (
     GAMAdUnit,
     GAMAdUnitSize,
@@ -133,6 +139,72 @@ class TestGAMSoapClient:
         with pytest.raises(RuntimeError, match="not connected"):
             client._ensure_connected()
 
+    def test_get_service_reuses_service(self):
+        """Test services are created once per name and dropped on disconnect."""
+        client = GAMSoapClient(
+            network_code="12345678",
+            credentials_path="/path/to/creds.json",
+        )
+        client._client = MagicMock()
+
+        first = client._get_service("OrderService")
+        assert client._get_service("OrderService") is first
+        client._client.GetService.assert_called_once_with("OrderService", version=client.api_version)
+
+        client.disconnect()
+        assert client._services == {}
+
+    def test_shared_client_connects_once(self):
+        """Test the shared client is connected once per set of credentials."""
+        reset_gam_soap_client()
+        with patch.object(GAMSoapClient, "connect") as mock_connect:
+            first = get_gam_soap_client("12345678", "/path/to/creds.json")
+            assert get_gam_soap_client("12345678", "/path/to/creds.json") is first
+            assert get_gam_soap_client("87654321", "/path/to/creds.json") is not first
+        assert mock_connect.call_count == 2
+        reset_gam_soap_client()
+
+    def test_reset_shared_client_reconnects(self):
+        """Test resetting a shared client disconnects it and only it."""
+        reset_gam_soap_client()
+        with patch.object(GAMSoapClient, "connect") as mock_connect:
+            first = get_gam_soap_client("12345678", "/path/to/creds.json")
+            other = get_gam_soap_client("87654321", "/path/to/creds.json")
+            with patch.object(first, "disconnect") as mock_disconnect:
+                reset_gam_soap_client("12345678", "/path/to/creds.json")
+            mock_disconnect.assert_called_once_with()
+            assert get_gam_soap_client("12345678", "/path/to/creds.json") is not first
+            assert get_gam_soap_client("87654321", "/path/to/creds.json") is other
+        assert mock_connect.call_count == 3
+        reset_gam_soap_client()
+
+    def test_handle_gam_error_only_resets_on_connection_errors(self):
+        """Test request errors keep the shared client and connection errors replace it."""
+        reset_gam_soap_client()
+        with patch.object(GAMSoapClient, "connect"):
+            first = get_gam_soap_client("12345678", "/path/to/creds.json")
+            handle_gam_error(ValueError("AuthenticationError"), "12345678", "/path/to/creds.json")
+            assert get_gam_soap_client("12345678", "/path/to/creds.json") is first
+            handle_gam_error(ConnectionResetError("reset by peer"), "12345678", "/path/to/creds.json")
+            assert get_gam_soap_client("12345678", "/path/to/creds.json") is not first
+        reset_gam_soap_client()
+
+    def test_is_gam_connection_error(self):
+        """Test transport and auth failures are told apart from request errors."""
+        assert is_gam_connection_error(ConnectionResetError("reset by peer"))
+        assert is_gam_connection_error(TimeoutError("timed out"))
+        assert not is_gam_connection_error(Exception("[AuthenticationError.NOT_WHITELISTED_FOR_API_ACCESS]"))
+
+    def test_is_gam_connection_error_server_faults(self):
+        """Test GAM faults count only when they carry an AuthenticationError."""
+        errors = pytest.importorskip("googleads.errors")
+
+        def fault(error_string):
+            return errors.GoogleAdsServerFault(None, errors=[MagicMock(errorString=error_string)])
+
+        assert is_gam_connection_error(fault("AuthenticationError.NOT_WHITELISTED_FOR_API_ACCESS"))
+        assert not is_gam_connection_error(fault("RequiredError.REQUIRED"))
+
     def test_to_soap_datetime(self):
         """Test datetime conversion to SOAP format."""
         client = GAMSoapClient(
@@ -224,6 +296,69 @@ class TestGAMSoapClient:
         assert line_item.cost_per_unit.to_dollars() == 15.0
         assert line_item.primary_goal.units == 1000000
 
+    def test_create_orders_single_round_trip(self):
+        """Test bulk order creation issues one createOrders call."""
+        client = GAMSoapClient(
+            network_code="12345678",
+            credentials_path="/path/to/creds.json",
+        )
+        client.default_trafficker_id = "222"
+
+        class MockOrder:
+            def __init__(self, order_id, name):
+                self.id = order_id
+                self.name = name
+                self.advertiserId = 111
+                self.traffickerId = 222
+                self.status = "DRAFT"
+
+        order_service = MagicMock()
+        order_service.createOrders.return_value = [
+            MockOrder(1, "Order A"),
+            MockOrder(2, "Order B"),
+        ]
+        client._get_service = MagicMock(return_value=order_service)
+
+        orders = client.create_orders([
+            {"name": "Order A", "advertiser_id": "111"},
+            {"name": "Order B", "advertiser_id": "111", "notes": "Second"},
+        ])
+
+        order_service.createOrders.assert_called_once()
+        payload = order_service.createOrders.call_args[0][0]
+        assert [o["name"] for o in payload] == ["Order A", "Order B"]
+        assert payload[0]["traffickerId"] == 222
+        assert payload[1]["notes"] == "Second"
+        assert [o.id for o in orders] == ["1", "2"]
+
+    def test_approve_orders_single_action(self):
+        """Test bulk approval uses one ApproveOrders action over an IN clause."""
+        client = GAMSoapClient(
+            network_code="12345678",
+            credentials_path="/path/to/creds.json",
+        )
+
+        class MockOrder:
+            def __init__(self, order_id):
+                self.id = order_id
+                self.name = f"Order {order_id}"
+                self.advertiserId = 111
+                self.traffickerId = 222
+                self.status = "APPROVED"
+
+        order_service = MagicMock()
+        order_service.getOrdersByStatement.return_value = MagicMock(
+            results=[MockOrder(1), MockOrder(2)]
+        )
+        client._get_service = MagicMock(return_value=order_service)
+
+        orders = client.approve_orders(["1", "2"])
+
+        order_service.performOrderAction.assert_called_once_with(
+            {"xsi_type": "ApproveOrders"}, {"query": "WHERE id IN (1, 2)"}
+        )
+        assert all(o.status == GAMOrderStatus.APPROVED for o in orders)
+
     def test_parse_audience_segment(self):
         """Test parsing audience segment from SOAP response."""
         client = GAMSoapClient(
@@ -0,0 +1,249 @@
+# Author: Green Mountain Systems AI Inc.
+# Donated to IAB Tech Lab
+
+"""Unit tests for the publisher GAM example server."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("orjson")
+
+from examples import publisher_gam_server as server
+
+
+class TestResolveProduct:
+    """Tests for shared product and floor validation."""
+
+    def test_pg_below_floor_message(self):
+        """Test PG below-floor errors keep their wording."""
+        product, error = server.resolve_product("ctv-hbo-max-001", "programmatic_guaranteed", 1.0)
+
+        assert product is None
+        assert error == {"error": "Price $1.0 below floor $26.0", "floor_price": 26.0}
+
+    def test_pmp_below_floor_message(self):
+        """Test PMP below-floor errors keep their wording."""
+        product, error = server.resolve_product("ctv-hbo-max-001", "private_marketplace", 1.0)
+
+        assert product is None
+        assert error == {"error": "Floor $1.0 below minimum $26.0", "minimum_floor": 26.0}
+
+    def test_bookable_product(self):
+        """Test a product at or above its floor resolves."""
+        product, error = server.resolve_product("ctv-hbo-max-001", "private_marketplace", 26.0)
+
+        assert error is None
+        assert product.id == "ctv-hbo-max-001"
+
+
+class TestMatchAdUnit:
+    """Tests for mapping products to GAM ad units by name."""
+
+    @staticmethod
+    def ad_unit_map(*names):
+        return {name.lower(): SimpleNamespace(id=str(i), name=name) for i, name in enumerate(names)}
+
+    def test_partial_token_match(self):
+        """Test names match on part of a word, not just whole words."""
+        ad_units = self.ad_unit_map("Sports Display", "HuluCTVPremium")
+
+        assert server.match_ad_unit("ctv", ad_units).name == "HuluCTVPremium"
+
+    def test_contained_ad_unit_name(self):
+        """Test an ad unit whose name sits inside the product's matches."""
+        ad_units = self.ad_unit_map("Sports Display", "Peacock")
+
+        assert server.match_ad_unit("peacock ctv", ad_units).name == "Peacock"
+
+    def test_first_match_in_listing_order_wins(self):
+        """Test the earliest containing ad unit wins, even over a later exact match."""
+        ad_units = self.ad_unit_map("Hulu CTV Premium", "Hulu CTV")
+
+        assert server.match_ad_unit("hulu ctv", ad_units).name == "Hulu CTV Premium"
+
+    def test_no_match(self):
+        """Test unrelated names do not match."""
+        ad_units = self.ad_unit_map("Sports Display", "News Mobile")
+
+        assert server.match_ad_unit("hbo max ctv", ad_units) is None
+
+
+class TestGAMBatcher:
+    """Tests for coalescing PG bookings into bulk GAM calls."""
+
+    @staticmethod
+    def fake_book_gam_orders(calls):
+        def book(bookings):
+            calls.append(list(bookings))
+            return [({"order_id": b["id"]}, None, None) for b in bookings]
+        return book
+
+    async def test_bookings_in_one_window_share_a_bulk_call(self):
+        """Test two bookings submitted within the batching window make one bulk call."""
+        calls = []
+        batcher = server.GAMBatcher(max_wait=0.05)
+        with patch.object(server, "book_gam_orders", self.fake_book_gam_orders(calls)):
+            batcher.start()
+            try:
+                first, second = await asyncio.gather(
+                    batcher.submit({"id": "a"}),
+                    batcher.submit({"id": "b"}),
+                )
+            finally:
+                await batcher.stop()
+
+        assert calls == [[{"id": "a"}, {"id": "b"}]]
+        assert first[0] == {"order_id": "a"}
+        assert second[0] == {"order_id": "b"}
+
+    async def test_stop_books_queued_bookings(self):
+        """Test stopping the batcher books what is queued instead of dropping it."""
+        calls = []
+        batcher = server.GAMBatcher(max_wait=10.0)
+        with patch.object(server, "book_gam_orders", self.fake_book_gam_orders(calls)):
+            batcher.start()
+            pending = asyncio.ensure_future(batcher.submit({"id": "a"}))
+            await asyncio.sleep(0)
+            await batcher.stop()
+
+        assert (await pending)[0] == {"order_id": "a"}
+        assert calls == [[{"id": "a"}]]
+
+
+class TestActivityLog:
+    """Tests for the activity-log queue."""
+
+    def test_logs_render_directly_until_listener_starts(self):
+        """Test records are not queued while no listener is draining the queue."""
+        server.log_event("MCP", "not queued: %s", "x")
+
+        assert server.activity_log.queue.empty()
+
+    def test_listener_drains_queue(self):
+        """Test records queue while the listener runs and are flushed on stop."""
+        log = server.activity_log
+        log.start()
+        try:
+            server.log_event("MCP", "queued: %s", "x")
+        finally:
+            log.stop()
+
+        assert log.queue.empty()
+        assert log.console_handler in log.logger.handlers
+        assert log.queue_handler not in log.logger.handlers
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match on the publisher's GET endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        return TestClient(server.app)
+
+    def test_tools_etag(self, client):
+        """Test the tool catalog carries a weak ETag and honours If-None-Match."""
+        response = client.get("/mcp/tools")
+        etag = response.headers["etag"]
+
+        assert response.status_code == 200
+        assert etag.startswith('W/"')
+        assert client.get("/mcp/tools", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/mcp/tools", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+        assert client.get("/mcp/tools", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    def test_deal_etag(self, client):
+        """Test a polled PMP deal returns 304 once the poller holds it."""
+        created = client.post("/mcp/call", json={
+            "name": "create_pmp_deal",
+            "arguments": {"product_id": "ctv-hulu-001", "floor_price": 20.0, "buyer_seat_id": "seat-1"},
+        }).json()
+        deal_id = created["result"]["deal"]["deal_id"]
+
+        first = client.get(f"/deals/{deal_id}")
+        assert first.status_code == 200
+        assert first.json()["deal_id"] == deal_id
+
+        again = client.get(f"/deals/{deal_id}", headers={"If-None-Match": first.headers["etag"]})
+        assert again.status_code == 304
+        assert again.content == b""
+
+
+class TestMCPEndpoints:
+    """Tests for /mcp/call, /mcp/batch and the tool result cache."""
+
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        return TestClient(server.app)
+
+    def test_call_returns_envelope(self, client):
+        """Test a tool call returns the success envelope around its result."""
+        body = client.post("/mcp/call", json={"name": "list_products", "arguments": {"publisher": "Hulu"}}).json()
+
+        assert body["success"] is True
+        assert body["tool"] == "list_products"
+        assert [p["id"] for p in body["result"]["products"]] == ["ctv-hulu-001"]
+
+    def test_call_malformed_envelope(self, client):
+        """Test a body that is not a tool call gets an error envelope."""
+        body = client.post("/mcp/call", content=b'{"arguments": {}}').json()
+
+        assert body["success"] is False
+        assert "name" in body["error"]
+
+    def test_batch_keeps_order_and_echoes_ids(self, client):
+        """Test batch results come back in request order, each tagged with its id."""
+        body = client.post("/mcp/batch", json={"requests": [
+            {"id": "first", "name": "get_pricing",
+             "arguments": {"product_id": "ctv-hulu-001", "deal_type": "private_marketplace"}},
+            {"id": 2, "name": "no_such_tool"},
+            {"name": "list_products", "arguments": {"publisher": "Peacock"}},
+        ]}).json()
+
+        assert body["success"] is True
+        first, second, third = body["results"]
+        assert first["id"] == "first" and first["success"] is True
+        assert first["result"]["product_id"] == "ctv-hulu-001"
+        assert second == {"id": 2, "success": False, "error": "Tool 'no_such_tool' not found"}
+        assert third["id"] is None and third["tool"] == "list_products"
+
+    def test_batch_call_cap(self, client):
+        """Test batches over MAX_BATCH_CALLS are refused."""
+        calls = [{"name": "list_products"}] * (server.MAX_BATCH_CALLS + 1)
+
+        body = client.post("/mcp/batch", json={"requests": calls}).json()
+
+        assert body == {"success": False, "error": f"Batch exceeds {server.MAX_BATCH_CALLS} calls"}
+
+    def test_batch_malformed_envelope(self, client):
+        """Test a batch body without a requests list gets an error envelope."""
+        body = client.post("/mcp/batch", content=b'{"requests": "list_products"}').json()
+
+        assert body["success"] is False
+        assert "requests" in body["error"]
+
+    def test_get_pricing_cache_refilled_after_refresh(self, client):
+        """Test get_pricing is served from cache, and recomputed once after invalidation."""
+        call = {"name": "get_pricing", "arguments": {
+            "product_id": "ctv-peacock-001", "buyer_tier": "agency", "deal_type": "programmatic_guaranteed",
+        }}
+        server.inventory.refresh_product_cache()
+
+        with patch.object(
+            server.pricing_engine, "calculate_price", wraps=server.pricing_engine.calculate_price
+        ) as calculate:
+            first = client.post("/mcp/call", json=call).json()
+            assert client.post("/mcp/call", json=call).json() == first
+            assert calculate.call_count == 1
+
+            server.inventory.refresh_product_cache()
+            assert client.post("/mcp/call", json=call).json() == first
+            assert client.post("/mcp/call", json=call).json() == first
+            assert calculate.call_count == 2